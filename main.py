@@ -245,6 +245,8 @@ def main():
 
                 config = {
                     "recursion_limit": 1000,
+                    # Bounds how many days are researched in parallel (keeps Tavily/LLM quotas in check)
+                    "max_concurrency": int(os.getenv("RESEARCHER_MAX_CONCURRENCY", "4")),
                 }
 
                 # Invoke graph
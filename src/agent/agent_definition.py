@@ -9,13 +9,15 @@ Built with LangChain 1.0:
 - Interrupt support for user approval of K-means organized itineraries
 """
 from typing import Dict, Any
+from functools import lru_cache
+from string import Template
 import uuid
 from langchain_core.messages import HumanMessage
 from langchain.agents import create_agent
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.types import Command
 from src.agent.tools import DAY_ORGANIZER_TOOLS, ATTRACTION_RESEARCHER_TOOLS
-from src.agent.prompts import DAY_ORGANIZER_PROMPT, ATTRACTION_RESEARCHER_PROMPT
+from src.agent import prompts
 from src.agent.state import GraphState, OrganizedItinerary, DayResearchResult
 from src.utils.logger import LOGGER
 from langchain.agents.structured_output import ToolStrategy
@@ -30,6 +32,18 @@ import os
 import anthropic
 import time
 
+# Tokens reserved for the model response
+_MAX_OUTPUT_TOKENS = 32768
+
+
+@lru_cache(maxsize=16)
+def _render_attraction_researcher_prompt(language: str) -> str:
+    """Render the attraction researcher system prompt (cached per language)."""
+    return Template(prompts.ATTRACTION_RESEARCHER_PROMPT).substitute(
+        language=language,
+        output_example=prompts.ATTRACTION_RESEARCHER_OUTPUT_EXAMPLE,
+    )
+
 
 def _initialize_llm(model_provider: str = "anthropic", model_name: str = "claude-sonnet-4-20250514"):
     """
@@ -53,16 +67,35 @@ def _initialize_llm(model_provider: str = "anthropic", model_name: str = "claude
         return ChatAnthropic(
             model=model_name,
             temperature=0,
-            max_tokens=32768
+            max_tokens=_MAX_OUTPUT_TOKENS
         )
     else:
         raise ValueError(f"Unsupported model provider: {model_provider}")
 
 
+def _provider_middleware(model_provider: str) -> list:
+    """
+    Get provider-specific middleware.
+
+    For Anthropic, marks the static system prompt and tool definitions as cacheable so
+    repeated model calls reuse the already-processed prompt prefix instead of
+    re-sending and re-processing it. OpenAI caches long prompt prefixes automatically.
+
+    Args:
+        model_provider: LLM provider ('openai' or 'anthropic')
+
+    Returns:
+        List of middleware instances (may be empty)
+    """
+    if model_provider == "anthropic":
+        from langchain_anthropic.middleware import AnthropicPromptCachingMiddleware
+        return [AnthropicPromptCachingMiddleware(ttl="5m")]
+    return []
+
+
 def create_day_organizer_agent(
     model_provider: str = "anthropic",
     model_name: str = "claude-sonnet-4-20250514",
-    num_days: int = 3,
     checkpointer=None
 ):
     """
@@ -79,7 +112,6 @@ def create_day_organizer_agent(
     Args:
         model_provider: LLM provider ('openai' or 'anthropic')
         model_name: Model name to use
-        num_days: Number of days for the itinerary (used in prompt)
         checkpointer: Checkpointer for state persistence (required for interrupt support)
 
     Returns:
@@ -90,9 +122,6 @@ def create_day_organizer_agent(
     # Initialize LLM
     llm = _initialize_llm(model_provider, model_name)
 
-    # Format prompt with num_days
-    formatted_prompt = DAY_ORGANIZER_PROMPT.replace("{num_days}", str(num_days))
-
     # Create validation middlewares
     validator_middleware = StructuredOutputValidatorMiddleware(
         expected_schema=OrganizedItinerary,
@@ -105,10 +134,10 @@ def create_day_organizer_agent(
     agent = create_agent(
         model=llm,
         tools=DAY_ORGANIZER_TOOLS,
-        system_prompt=formatted_prompt,
+        system_prompt=prompts.DAY_ORGANIZER_PROMPT,
         state_schema=GraphState,
         response_format=ToolStrategy(OrganizedItinerary),
-        middleware=[clustering_validator_middleware, validator_middleware],
+        middleware=[*_provider_middleware(model_provider), clustering_validator_middleware, validator_middleware],
         checkpointer=checkpointer
     )
 
@@ -145,7 +174,7 @@ def create_attraction_researcher_agent(
     llm = _initialize_llm(model_provider, model_name)
 
     # Format prompt with language
-    formatted_prompt = ATTRACTION_RESEARCHER_PROMPT.replace("{language}", language)
+    formatted_prompt = _render_attraction_researcher_prompt(language)
 
     # Create validation middleware
     validator_middleware = StructuredOutputValidatorMiddleware(
@@ -160,7 +189,7 @@ def create_attraction_researcher_agent(
         system_prompt=formatted_prompt,
         state_schema=GraphState,
         response_format=ToolStrategy(DayResearchResult),
-        middleware=[validator_middleware]
+        middleware=[*_provider_middleware(model_provider), validator_middleware]
     )
 
     LOGGER.info("Attraction researcher agent created successfully with validation middleware")
@@ -227,8 +256,27 @@ def day_organizer_node(state: GraphState) -> Dict[str, Any]:
     model_name = os.getenv("MODEL_NAME", "claude-sonnet-4-5-20250929")
     max_retries = int(os.getenv("STRUCTURED_OUTPUT_MAX_RETRIES", "3"))
 
-    # Prepare initial input message
-    full_input = f"{user_input}\n\nPreferences: {preferences_input}" if preferences_input else user_input
+    # Prepare initial input message. The number of days goes here, not in the system prompt,
+    # so the system prompt is identical for every request and stays in the provider's prompt cache.
+    full_input = f"Number of days: {num_days}\n\n{user_input}"
+    if preferences_input:
+        full_input += f"\n\nPreferences: {preferences_input}"
+
+    # Pre-flight context budget check (avoids a failing provider call and its retries)
+    context_limit = int(os.getenv("MODEL_CONTEXT_TOKENS", "200000"))
+    estimated_tokens = prompts.DAY_ORGANIZER_PROMPT_TOKENS + len(full_input) // prompts.CHARS_PER_TOKEN
+    if estimated_tokens > context_limit - _MAX_OUTPUT_TOKENS:
+        LOGGER.error(f"❌ Input too large: ~{estimated_tokens} tokens (limit {context_limit - _MAX_OUTPUT_TOKENS})")
+        LOGGER.info("="*60)
+        return {
+            "document_title": f"Travel Itinerary - {num_days} Days",
+            "attractions_by_day": [],
+            "clusters": [],
+            "attraction_coordinates": {},
+            "invalid_input": True,
+            "error_message": "The input is too long to process. Please shorten the attractions list or preferences and try again."
+        }
+
     messages = [HumanMessage(content=full_input)]
 
     # Create checkpointer and thread_id for interrupt support
@@ -246,7 +294,6 @@ def day_organizer_node(state: GraphState) -> Dict[str, Any]:
             agent = create_day_organizer_agent(
                 model_provider=model_provider,
                 model_name=model_name,
-                num_days=num_days,
                 checkpointer=checkpointer,
             )
 
@@ -474,7 +521,7 @@ Remember to:
 
             LOGGER.info(f"{log_prefix} | ✅ Completed - {len(attractions_results)} attractions researched")
 
-            # Return as list because processed_attractions uses operator.add reducer
+            # Return as list because processed_attractions uses the extend_list reducer
             return {"processed_attractions": attractions_results}
 
         except StructuredOutputValidationError as e:
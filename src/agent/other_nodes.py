@@ -6,15 +6,21 @@ Contains:
 - build_document_node: Final node that generates the DOCX document
 """
 import os
-from typing import Dict, Any, List, Union, Literal
+from collections import defaultdict
+from typing import Dict, Any, Iterator, List, Tuple, Union, Literal
 from langgraph.types import Send
 from langgraph.graph import END
 from src.agent.state import GraphState
-from src.processor.docx_processor import LocalDocxGenerator
+from src.processor.docx_processor import LocalDocxGenerator, prefetch_images
+from src.utils.cache import make_cache_key
 from src.utils.logger import LOGGER
 
 _docx_generator = None
 
+# Documents generated in this session, so regenerating an identical itinerary reuses the file
+# {content_key: (file_path, file_mtime)}
+_document_cache = {}
+
 def get_docx_generator():
     """Get or create local DOCX generator."""
     global _docx_generator
@@ -116,31 +122,159 @@ def build_document_node(state: GraphState) -> Dict[str, Any]:
 
     LOGGER.info(f"Processing {len(processed_attractions)} attractions for document")
 
-    # Group attractions by day
-    attractions_by_day = {}
+    # Group attractions by day and total their costs (needed up front: the cost
+    # summary block is emitted after the days)
+    attractions_by_day, costs_by_currency = _analyze_attractions(processed_attractions)
+
+    # Identical content (e.g. the same itinerary generated twice in a session) reuses the file
+    clusters = state.get("clusters", [])
+    document_key = make_cache_key({
+        "title": document_title,
+        "language": language,
+        "attractions": processed_attractions,
+        "clusters": clusters.tolist() if hasattr(clusters, "tolist") else clusters,
+        "coordinates": state.get("attraction_coordinates", {}),
+    })
+
+    cached_path = _get_cached_document(document_key)
+    if cached_path:
+        LOGGER.info(f"Reusing previously generated document: {cached_path}")
+        return {
+            "final_document_path": cached_path,
+            "costs_by_currency": costs_by_currency,
+        }
+
+    # Language-specific labels
+    labels = _get_language_labels(language)
+
+    # Blocks are produced lazily and consumed by the DOCX generator as they are written
+    content_blocks = _iter_content_blocks(state, attractions_by_day, costs_by_currency, labels)
+
+    # Create DOCX document
+    try:
+        generator = get_docx_generator()
+        LOGGER.info("DOCX generator initialized")
+
+        # Download all images concurrently instead of one by one while writing
+        images = prefetch_images(
+            img.get("url_regular")
+            for attractions in attractions_by_day.values()
+            for attraction in attractions
+            for img in _ensure_list(attraction.get("images"))
+            if isinstance(img, dict)
+        )
+
+        LOGGER.info(f"Using document title: {document_title}")
+        LOGGER.info(f"Calling create_document (language: {language})")
+        file_path = generator.create_document(
+            title=document_title, content_blocks=content_blocks, language=language, images=images
+        )
+
+        LOGGER.info(f"Document created successfully at: {file_path}")
+
+        if not file_path or not os.path.exists(file_path):
+            LOGGER.error(f"Document file does not exist: {file_path}")
+            return {
+                "final_document_path": "",
+                "costs_by_currency": costs_by_currency,
+            }
+
+        _document_cache[document_key] = (file_path, os.path.getmtime(file_path))
+
+        return {
+            "final_document_path": file_path,
+            "costs_by_currency": costs_by_currency,
+        }
+
+    except Exception as e:
+        LOGGER.error(f"Document generation failed: {e}", exc_info=True)
+        return {
+            "final_document_path": "",
+            "costs_by_currency": costs_by_currency,
+        }
+
+
+def _get_cached_document(document_key: str) -> str:
+    """
+    Return the path of a document already generated for the same content, or "".
+
+    The file name comes from the title, so a later itinerary with the same title
+    overwrites it; the stored modification time detects that.
+    """
+    cached = _document_cache.get(document_key)
+    if not cached:
+        return ""
+
+    file_path, mtime = cached
+    try:
+        if os.path.getmtime(file_path) == mtime:
+            return file_path
+    except OSError:
+        pass
+
+    del _document_cache[document_key]
+    return ""
+
+
+def _ensure_list(value: Any) -> List[Any]:
+    """Return value if it is a list, otherwise an empty list (guards malformed LLM output)."""
+    return value if isinstance(value, list) else []
+
+
+def _analyze_attractions(
+    processed_attractions: List[Dict[str, Any]],
+) -> Tuple[Dict[int, List[Dict[str, Any]]], Dict[str, float]]:
+    """
+    Group attractions by day and total their estimated costs in a single pass.
+
+    Args:
+        processed_attractions: Attractions returned by the researcher workers
+
+    Returns:
+        Tuple of (attractions grouped by day number, {currency: total_cost})
+    """
+    attractions_by_day = defaultdict(list)
+    costs_by_currency = defaultdict(float)
     for attraction in processed_attractions:
         if not isinstance(attraction, dict):
             LOGGER.warning(f"Attraction is not a dict: {type(attraction).__name__}")
             continue
 
-        day_number = attraction.get("day_number", 1)
-        if day_number not in attractions_by_day:
-            attractions_by_day[day_number] = []
-        attractions_by_day[day_number].append(attraction)
+        attractions_by_day[attraction.get("day_number", 1)].append(attraction)
 
-    # Prepare content blocks for document
-    content_blocks = []
-    costs_by_currency = {}  # {currency: total_cost}
+        cost = attraction.get("estimated_cost") or 0.0
+        if cost > 0:
+            costs_by_currency[attraction.get("currency", "EUR")] += cost  # Default to EUR if not specified
 
-    # Language-specific labels
-    labels = _get_language_labels(language)
+    return attractions_by_day, dict(costs_by_currency)
+
+
+def _iter_content_blocks(
+    state: GraphState,
+    attractions_by_day: Dict[int, List[Dict[str, Any]]],
+    costs_by_currency: Dict[str, float],
+    labels: Dict[str, str],
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the document content blocks (headings, paragraphs, images, etc.) in order.
+
+    Args:
+        state: Graph state (document title, clusters and coordinates for the final map)
+        attractions_by_day: Processed attractions grouped by day number
+        costs_by_currency: Cost totals for the summary section
+        labels: Language-specific labels
+
+    Yields:
+        Content block dicts in the format expected by LocalDocxGenerator.create_document
+    """
+    # The same photo can be returned for several attractions; embed it only once
+    seen_image_urls = set()
 
     # Add each day
-    for day_number in sorted(attractions_by_day.keys()):
-        attractions = attractions_by_day[day_number]
+    for day_number, attractions in sorted(attractions_by_day.items()):
 
         # Add day heading
-        content_blocks.append({"type": "heading", "text": f"{labels['day']} {day_number}", "level": 1})
+        yield {"type": "heading", "text": f"{labels['day']} {day_number}", "level": 1}
 
         # Add each attraction under this day
         for attraction in attractions:
@@ -150,7 +284,7 @@ def build_document_node(state: GraphState) -> Dict[str, Any]:
             LOGGER.info(f"Processing attraction: {name} (Day {day_number})")
 
             # Add attraction as subheading
-            content_blocks.append({"type": "heading", "text": name, "level": 2})
+            yield {"type": "heading", "text": name, "level": 2}
 
             # Add description - parse bullet points
             if description:
@@ -170,41 +304,32 @@ def build_document_node(state: GraphState) -> Dict[str, Any]:
                     else:
                         # If we have accumulated bullet points, add them first
                         if bullet_points:
-                            content_blocks.append({"type": "bullet_list", "items": bullet_points})
+                            yield {"type": "bullet_list", "items": bullet_points}
                             bullet_points = []
 
-                        content_blocks.append({"type": "paragraph", "text": line})
+                        yield {"type": "paragraph", "text": line}
 
                 # Add any remaining bullet points
                 if bullet_points:
-                    content_blocks.append({"type": "bullet_list", "items": bullet_points})
+                    yield {"type": "bullet_list", "items": bullet_points}
 
             # Add images
-            images = attraction.get("images", [])
-            if not isinstance(images, list):
-                images = []
-
-            for idx, img in enumerate(images):
+            for idx, img in enumerate(_ensure_list(attraction.get("images"))):
                 if not isinstance(img, dict):
                     continue
 
                 url = img.get("url_regular")
-                if not url:
+                if not url or url in seen_image_urls:
                     continue
+                seen_image_urls.add(url)
 
-                content_blocks.append(
-                    {"type": "image", "url": url, "id": img.get("id", f"img_{idx}"), "caption": img.get("caption", "")}
-                )
+                yield {"type": "image", "url": url, "id": img.get("id", f"img_{idx}"), "caption": img.get("caption", "")}
 
             # Add ticket/cost info
-            ticket_info = attraction.get("ticket_info", [])
-            if not isinstance(ticket_info, list):
-                ticket_info = []
+            ticket_info = _ensure_list(attraction.get("ticket_info"))
 
             if ticket_info:
-                content_blocks.append(
-                    {"type": "heading", "text": labels["ticket_info"], "level": 3}
-                )
+                yield {"type": "heading", "text": labels["ticket_info"], "level": 3}
 
                 for info in ticket_info:
                     if not isinstance(info, dict):
@@ -212,48 +337,32 @@ def build_document_node(state: GraphState) -> Dict[str, Any]:
 
                     content = info.get("content", "")
                     if content:
-                        content_blocks.append({"type": "paragraph", "text": f"• {content}"})
+                        yield {"type": "paragraph", "text": f"• {content}"}
 
                     url = info.get("url")
                     if url:
-                        content_blocks.append({"type": "paragraph", "text": f"Link: {url}"})
+                        yield {"type": "paragraph", "text": f"Link: {url}"}
 
             # Add useful links
-            links = attraction.get("useful_links", [])
-            if not isinstance(links, list):
-                links = []
-
-            if links:
-                content_blocks.append({"type": "heading", "text": labels["useful_links"], "level": 3})
-
-                link_items = []
-                for link in links:
-                    if isinstance(link, dict):
-                        title = link.get("title", "Link")
-                        url = link.get("url", "")
-                        if url:
-                            link_items.append(f"{title}: {url}")
-
-                if link_items:
-                    content_blocks.append({"type": "bullet_list", "items": link_items})
-
-            # Try to extract cost and currency
-            cost = attraction.get("estimated_cost", 0.0)
-            currency = attraction.get("currency", "EUR")  # Default to EUR if not specified
-            if cost > 0:
-                if currency not in costs_by_currency:
-                    costs_by_currency[currency] = 0.0
-                costs_by_currency[currency] += cost
+            link_items = [
+                f"{link.get('title', 'Link')}: {link['url']}"
+                for link in _ensure_list(attraction.get("useful_links"))
+                if isinstance(link, dict) and link.get("url")
+            ]
+
+            if link_items:
+                yield {"type": "heading", "text": labels["useful_links"], "level": 3}
+                yield {"type": "bullet_list", "items": link_items}
 
             # Add page break after each attraction
-            content_blocks.append({"type": "page_break"})
+            yield {"type": "page_break"}
 
         # Add spacing between days
-        content_blocks.append({"type": "paragraph", "text": ""})
+        yield {"type": "paragraph", "text": ""}
 
     # Add cost summary grouped by currency
     if costs_by_currency:
-        content_blocks.append({"type": "heading", "text": labels["cost_summary"], "level": 1})
+        yield {"type": "heading", "text": labels["cost_summary"], "level": 1}
 
         # Currency symbols for common currencies
         currency_symbols = {
@@ -272,50 +381,19 @@ def build_document_node(state: GraphState) -> Dict[str, Any]:
             symbol = currency_symbols.get(currency, currency)
             cost_items.append(f"{symbol} {total:.2f} ({currency})")
 
-        content_blocks.append({"type": "bullet_list", "items": cost_items})
-        content_blocks.append(
-            {
-                "type": "paragraph",
-                "text": labels["estimated_per_person"],
-                "bold": False,
-            }
-        )
-
-    content_blocks.append({"type": "final_image", "title": state.get("document_title", ""), "clusters": state.get("clusters", []), "attraction_coordinates": state.get("attraction_coordinates", {})})
-
-    LOGGER.info(f"Prepared {len(content_blocks)} content blocks for document")
-
-    # Create DOCX document
-    try:
-        generator = get_docx_generator()
-        LOGGER.info("DOCX generator initialized")
-
-        LOGGER.info(f"Using document title: {document_title}")
-        LOGGER.info(f"Calling create_document with {len(content_blocks)} blocks (language: {language})")
-        file_path = generator.create_document(
-            title=document_title, content_blocks=content_blocks, language=language
-        )
-
-        LOGGER.info(f"Document created successfully at: {file_path}")
-
-        if not file_path or not os.path.exists(file_path):
-            LOGGER.error(f"Document file does not exist: {file_path}")
-            return {
-                "final_document_path": "",
-                "costs_by_currency": costs_by_currency,
-            }
-
-        return {
-            "final_document_path": file_path,
-            "costs_by_currency": costs_by_currency,
+        yield {"type": "bullet_list", "items": cost_items}
+        yield {
+            "type": "paragraph",
+            "text": labels["estimated_per_person"],
+            "bold": False,
         }
 
-    except Exception as e:
-        LOGGER.error(f"Document generation failed: {e}", exc_info=True)
-        return {
-            "final_document_path": "",
-            "costs_by_currency": costs_by_currency,
-        }
+    yield {
+        "type": "final_image",
+        "title": state.get("document_title", ""),
+        "clusters": state.get("clusters", []),
+        "attraction_coordinates": state.get("attraction_coordinates", {}),
+    }
 
 
 def _get_language_labels(language: str) -> Dict[str, str]:
@@ -1,8 +1,7 @@
 """State schema and TypedDict models for the multi-agent itinerary graph."""
 from typing import TypedDict, Annotated, List, Dict, Any
-import operator
 import numpy
-from src.utils.utilities import merge_dicts, replace_value
+from src.utils.utilities import merge_dicts, replace_value, extend_list
 
 
 # ============================================================================
@@ -79,7 +78,7 @@ class GraphState(TypedDict):
     # Using merge_dicts to properly merge coordinate updates from multiple extract_coordinates calls
     attraction_coordinates: Annotated[Dict[str, Dict[str, float]], merge_dicts]  # {attraction_name: {lat: float, lon: float}}
     all_coordinates_obtained: Annotated[bool, replace_value]  # True when all attractions have coordinates
-    clusters: numpy.ndarray  # Cluster labels for each attraction
+    clusters: numpy.ndarray  # Cluster (0-indexed day) label for each attraction, dtype int16
 
     # First agent output (day organizer)
     document_title: str  # Generated document title
@@ -94,8 +93,8 @@ class GraphState(TypedDict):
     user_feedback: str  # User's feedback if they request changes
 
     # Second agent outputs (accumulated from parallel executions - one per day)
-    # Using Annotated with operator.add to accumulate results from parallel Send() calls
-    processed_attractions: Annotated[List[Dict[str, Any]], operator.add]
+    # Using Annotated with extend_list to accumulate results from parallel Send() calls
+    processed_attractions: Annotated[List[Dict[str, Any]], extend_list]
 
     # Invalid input handling
     invalid_input: bool  # True if input is invalid/unrelated
@@ -1,30 +1,242 @@
 """Tools for the multi-agent itinerary generation graph."""
+import os
 import json
+import threading
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+from urllib.parse import urlsplit
 from langchain.tools import tool, ToolRuntime
 from langchain.messages import ToolMessage
 from langgraph.types import Command, interrupt
+from langsmith import traceable
+# Copies contextvars into worker threads, so @traceable spans nest under the calling tool's trace
+from langsmith.utils import ContextThreadPoolExecutor
 from src.mcp_client.tavily_client import TavilyMCPClient
 from src.utils.logger import LOGGER
-from geopy.geocoders import Nominatim
-from geopy.distance import geodesic
-from sklearn.cluster import KMeans
-from k_means_constrained import KMeansConstrained
+from src.utils.cache import DiskCache, make_cache_key
+from src.utils.rate_limiter import TokenBucket
 import numpy as np
 
+# geopy, k-means-constrained and scipy are imported where they are used:
+# together they add a noticeable delay to startup and are only needed by some tools.
+
 
 # Global clients (initialized on first use)
 _tavily_client = None
 _geolocator = None
+_local_geolocator = None
+_google_geolocator = None
+
+# Tavily search responses, shared by parallel researcher workers (in-process, then on-disk)
+# {cache_key: raw Tavily response}
+_search_results_cache = {}
+_search_results_lock = threading.Lock()
+_search_disk_cache = None
+# Bump the suffix whenever the cache key changes, so entries stored under old keys are ignored
+SEARCH_CACHE_NAMESPACE = "search_v2"
+# Searches currently running, so concurrent workers asking the same query wait for one request
+# {cache_key: threading.Event}
+_search_in_flight = {}
+
+# On-disk geocoding cache directory; bump the suffix whenever the cache key changes
+GEOCODE_CACHE_NAMESPACE = "geocode_v2"
+
+# Geocoding throttle shared by all worker threads (initialized on first use)
+_geocode_lock = threading.Lock()
+_geocode_rate_limiter = None
+
+# Geocoding results (in-process, then on-disk), keyed by normalized address
+# {cache_key: {"lat": float, "lon": float}}
+_geocode_cache = {}
+_geocode_cache_lock = threading.Lock()
+_geocode_disk_cache = None
+
+# Accent folding for cache keys (lowercase input)
+_ACCENT_TABLE = str.maketrans({
+    **dict(zip("áàâãäåéèêëíìîïóòôõöúùûüçñý", "aaaaaaeeeeiiiiooooouuuucny")),
+    "œ": "oe", "æ": "ae", "ß": "ss",
+})
+
+# Upper bound on images returned per image search, whatever count the agent asks for
+MAX_IMAGE_RESULTS = 10
+
+# Day organization memoization (in-process, then on-disk)
+# Bump the version whenever the organization algorithm changes to invalidate old entries
+ORGANIZATION_ALGORITHM_VERSION = 7
+_organization_cache = {}
+_organization_disk_cache = None
 
 
 def get_geolocator():
-    """Get or create geolocator for distance calculations."""
+    """
+    Get or create geolocator for distance calculations.
+
+    Geocoders use geopy's RequestsAdapter, which keeps one requests.Session, so
+    consecutive geocodes reuse the same HTTPS connection instead of reconnecting.
+    """
     global _geolocator
-    if _geolocator is None:
-        _geolocator = Nominatim(user_agent="itinerary_generator")
+    with _geocode_lock:
+        if _geolocator is None:
+            from geopy.adapters import RequestsAdapter
+            from geopy.geocoders import Nominatim
+            _geolocator = Nominatim(user_agent="itinerary-generator/1.0", adapter_factory=RequestsAdapter)
     return _geolocator
 
 
+def get_local_geolocator():
+    """
+    Get or create the self-hosted Photon geocoder configured by PHOTON_URL.
+
+    Returns:
+        Photon geocoder, or None if PHOTON_URL is not set
+    """
+    global _local_geolocator
+    photon_url = os.getenv("PHOTON_URL")
+    if not photon_url:
+        return None
+    with _geocode_lock:
+        if _local_geolocator is None:
+            from geopy.adapters import RequestsAdapter
+            from geopy.geocoders import Photon
+            parts = urlsplit(photon_url)
+            _local_geolocator = Photon(
+                domain=parts.netloc + parts.path.rstrip("/"),
+                scheme=parts.scheme or "http",
+                user_agent="itinerary-generator/1.0",
+                adapter_factory=RequestsAdapter,
+            )
+    return _local_geolocator
+
+
+def get_google_geolocator():
+    """
+    Get or create the Google Maps geocoder when GOOGLE_MAPS_API_KEY is set.
+
+    Google allows far more than Nominatim's 1 request per second and is more precise
+    for landmarks, so when configured it is tried before Nominatim without throttling.
+
+    Returns:
+        GoogleV3 geocoder, or None if GOOGLE_MAPS_API_KEY is not set
+    """
+    global _google_geolocator
+    api_key = os.getenv("GOOGLE_MAPS_API_KEY")
+    if not api_key:
+        return None
+    with _geocode_lock:
+        if _google_geolocator is None:
+            from geopy.adapters import RequestsAdapter
+            from geopy.geocoders import GoogleV3
+            _google_geolocator = GoogleV3(api_key=api_key, adapter_factory=RequestsAdapter)
+    return _google_geolocator
+
+
+def _normalize_text(text: str) -> str:
+    """
+    Normalize text (accents, case, whitespace) so equivalent spellings share a cache slot.
+
+    Accents common in Portuguese, Spanish and French go through a precompiled translate
+    table; for the rare leftovers, Unicode decomposition strips only the combining marks,
+    so non-Latin scripts (Cyrillic, Greek, CJK, ...) are kept and stay distinct.
+    """
+    text = text.lower().translate(_ACCENT_TABLE)
+    if not text.isascii():
+        text = "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    return " ".join(text.split())
+
+
+def _normalize_address(address: str) -> str:
+    """Normalize an address for the geocoding cache key."""
+    return _normalize_text(address)
+
+
+def _get_geocode_disk_cache() -> DiskCache:
+    """Get or create the on-disk geocoding cache (TTL from GEOCODE_CACHE_TTL_DAYS, default 30)."""
+    global _geocode_disk_cache
+    if _geocode_disk_cache is None:
+        ttl_days = float(os.getenv("GEOCODE_CACHE_TTL_DAYS", "30"))
+        _geocode_disk_cache = DiskCache(GEOCODE_CACHE_NAMESPACE, ttl_seconds=ttl_days * 86400)
+    return _geocode_disk_cache
+
+
+def _get_cached_geocode(original_name: str, address: str):
+    """Look up an address in the in-process, then on-disk geocoding cache (None on miss)."""
+    cache_key = _normalize_address(address)
+
+    with _geocode_cache_lock:
+        cached = _geocode_cache.get(cache_key)
+    if cached is not None:
+        LOGGER.info(f"Geocoding cache hit (memory): {original_name}")
+        return cached
+
+    # Hashed on disk: the normalized address may contain characters not valid in file names
+    cached = _get_geocode_disk_cache().get(make_cache_key(cache_key))
+    if cached is not None:
+        LOGGER.info(f"Geocoding cache hit (disk): {original_name}")
+        with _geocode_cache_lock:
+            _geocode_cache[cache_key] = cached
+    return cached
+
+
+def get_geocode_rate_limiter() -> TokenBucket:
+    """Get or create the geocoding rate limiter (one request per GEOCODER_MIN_DELAY_SECONDS)."""
+    global _geocode_rate_limiter
+    with _geocode_lock:
+        if _geocode_rate_limiter is None:
+            min_delay = float(os.getenv("GEOCODER_MIN_DELAY_SECONDS", "1.0"))
+            _geocode_rate_limiter = TokenBucket(rate=1 / min_delay, burst=1)
+    return _geocode_rate_limiter
+
+
+@traceable(name="geocode", run_type="tool")
+def _geocode_address(original_name: str, address: str):
+    """
+    Geocode a single address and cache the result.
+
+    Unthrottled backends are tried first, in order: a self-hosted Photon instance
+    (PHOTON_URL) and Google Maps (GOOGLE_MAPS_API_KEY). If none is configured or none
+    finds the address, Nominatim is used, with request starts paced by a shared token
+    bucket: its usage policy allows at most 1 request per second, so concurrent workers
+    overlap network latency but never exceed that request rate.
+    Failed lookups are not cached, so the agent can retry with a better address.
+
+    Returns:
+        {"lat": float, "lon": float}, or None if the address was not found
+    """
+    location = None
+
+    for backend, get_backend in (("Photon", get_local_geolocator), ("Google", get_google_geolocator)):
+        fast_geolocator = get_backend()
+        if fast_geolocator is None:
+            continue
+        try:
+            LOGGER.info(f"Geocoding '{original_name}' with {backend} using address: {address}")
+            location = fast_geolocator.geocode(address, timeout=10)
+        except Exception as e:
+            LOGGER.warning(f"{backend} geocoding failed for '{original_name}': {e}")
+        if location:
+            break
+
+    if not location:
+        geolocator = get_geolocator()
+        waited = get_geocode_rate_limiter().acquire()
+        if waited:
+            LOGGER.info(f"Geocoding rate limiter waited {waited:.2f}s")
+
+        LOGGER.info(f"Geocoding '{original_name}' using address: {address}")
+        location = geolocator.geocode(address, timeout=10)
+
+    if not location:
+        return None
+
+    coordinates = {"lat": location.latitude, "lon": location.longitude}
+    cache_key = _normalize_address(address)
+    with _geocode_cache_lock:
+        _geocode_cache[cache_key] = coordinates
+    _get_geocode_disk_cache().set(make_cache_key(cache_key), coordinates)
+    return coordinates
+
+
 def get_tavily_client():
     """Get or create Tavily MCP client."""
     global _tavily_client
@@ -37,6 +249,128 @@ def get_tavily_client():
     return _tavily_client
 
 
+def _normalize_query(query: str) -> str:
+    """Normalize a search query for the search cache key."""
+    return _normalize_text(query)
+
+
+def _get_search_disk_cache() -> DiskCache:
+    """Get or create the on-disk search cache (TTL from SEARCH_CACHE_TTL_DAYS, default 30)."""
+    global _search_disk_cache
+    if _search_disk_cache is None:
+        ttl_days = float(os.getenv("SEARCH_CACHE_TTL_DAYS", "30"))
+        _search_disk_cache = DiskCache(SEARCH_CACHE_NAMESPACE, ttl_seconds=ttl_days * 86400)
+    return _search_disk_cache
+
+
+def _cached_search(client: TavilyMCPClient, query: str, **search_params) -> dict:
+    """
+    Run a Tavily search through the in-process and on-disk caches.
+
+    The raw Tavily response is cached (not the formatted tool output), keyed on the
+    normalized query and search parameters. Empty responses are not cached.
+    If another worker is already running the same search, this call waits for its result.
+    """
+    cache_key = make_cache_key({"query": _normalize_query(query), **search_params})
+
+    with _search_results_lock:
+        cached = _search_results_cache.get(cache_key)
+        in_flight = _search_in_flight.get(cache_key)
+        if cached is None and in_flight is None:
+            # This call owns the search; concurrent callers wait on its event
+            done = _search_in_flight[cache_key] = threading.Event()
+
+    if cached is None and in_flight is not None:
+        in_flight.wait()
+        with _search_results_lock:
+            cached = _search_results_cache.get(cache_key)
+        if cached is None:
+            # The other worker got an empty response; search again without deduplication
+            return _fetch_search(client, query, cache_key, **search_params)
+
+    if cached is not None:
+        LOGGER.info(f"Search cache hit (memory): {query}")
+        return cached
+
+    try:
+        return _fetch_search(client, query, cache_key, **search_params)
+    finally:
+        with _search_results_lock:
+            del _search_in_flight[cache_key]
+        done.set()
+
+
+@traceable(name="tavily_search", run_type="retriever")
+def _fetch_search(client: TavilyMCPClient, query: str, cache_key: str, **search_params) -> dict:
+    """Read a search from the disk cache, or run it and store non-empty responses in both caches."""
+    cached = _get_search_disk_cache().get(cache_key)
+    if cached is not None:
+        LOGGER.info(f"Search cache hit (disk): {query}")
+        with _search_results_lock:
+            _search_results_cache[cache_key] = cached
+        return cached
+
+    search_data = client.search(query, **search_params)
+
+    if search_data.get("results") or search_data.get("images"):
+        with _search_results_lock:
+            _search_results_cache[cache_key] = search_data
+        _get_search_disk_cache().set(cache_key, search_data)
+
+    return search_data
+
+
+def forget_search_cache() -> None:
+    """Clear the in-process and on-disk Tavily search caches."""
+    with _search_results_lock:
+        _search_results_cache.clear()
+    _get_search_disk_cache().clear()
+    LOGGER.info("Search cache cleared")
+
+
+def _search_info(client: TavilyMCPClient, query: str) -> list:
+    """Run an advanced web search and keep url, title and content of each result."""
+    search_results = _cached_search(
+        client,
+        query,
+        max_results=3,
+        search_depth="advanced",
+    )
+    return [
+        {"url": res["url"], "title": res["title"], "content": res.get("content", "")}
+        for res in search_results.get("results", [])
+    ]
+
+
+def _search_images(client: TavilyMCPClient, query: str, count: int) -> list:
+    """Run an image search and return up to count images, skipping watermarked ones."""
+    count = max(1, min(count, MAX_IMAGE_RESULTS))
+    search_data = _cached_search(
+        client,
+        query,
+        max_results=count,
+        search_depth="advanced",
+        include_images=True,
+        include_image_descriptions=True
+    )
+
+    images = []
+    for img_object in search_data.get("images") or []:
+        # Without descriptions Tavily returns bare URL strings
+        if isinstance(img_object, str):
+            img_object = {"url": img_object}
+        description = img_object.get("description") or ""
+        if not img_object.get("url") or "watermark" in description.lower():
+            continue
+        images.append({
+            "url_regular": img_object["url"],
+            "description": description,
+        })
+        if len(images) == count:
+            break
+    return images
+
+
 @tool
 def search_attraction_info(
     query: str,
@@ -58,16 +392,7 @@ def search_attraction_info(
         }, ensure_ascii=False)
 
     try:
-        search_results = client.search(
-            query,
-            max_results=3,
-            search_depth="advanced",
-        )
-
-        tool_output = search_results.get("results", [])
-        tool_output = [{"url": res["url"], "title": res["title"], "content": res.get("content", "")} for res in tool_output]
-
-        return json.dumps(tool_output, ensure_ascii=False, indent=2)
+        return json.dumps(_search_info(client, query), ensure_ascii=False, separators=(",", ":"))
 
     except Exception as e:
         return json.dumps({
@@ -76,19 +401,20 @@ def search_attraction_info(
 
 
 @tool
-def search_attraction_images(
+def research_location(
     query: str,
-    count: int = 5
+    image_count: int = 5,
 ) -> str:
     """
-    Search for high-quality images of a tourist attraction using Tavily.
+    Research one location in a single call: web search for practical information and
+    image search, run in parallel. Watermarked images are already filtered out.
 
     Args:
-        query: Search query (attraction name, city, etc.)
-        count: Number of images to fetch (default: 5)
+        query: Location to research (name and city, e.g. "Trocadero Paris")
+        image_count: Number of images to fetch (default: 5)
 
     Returns:
-        JSON string with image URLs found
+        JSON string with "info" (search results) and "images" (image URLs and descriptions)
     """
     client = get_tavily_client()
     if not client:
@@ -97,32 +423,20 @@ def search_attraction_images(
         }, ensure_ascii=False)
 
     try:
-        search_data = client.search(
-            query,
-            max_results=count,
-            search_depth="advanced",
-            include_images=True,
-            include_image_descriptions=True
-        )
-
-        images = search_data.get("images", [])
+        with ContextThreadPoolExecutor(max_workers=2) as executor:
+            info_future = executor.submit(_search_info, client, query)
+            images_future = executor.submit(_search_images, client, query, image_count)
 
         result = {
-            "images_found": len(images),
-            "images": []
+            "info": info_future.result(),
+            "images": images_future.result(),
         }
 
-        for img_object in images[:count]:
-            result["images"].append({
-                "url_regular": img_object["url"],
-                "description": img_object["description"],
-            })
-
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
 
     except Exception as e:
         return json.dumps({
-            "error": f"Image search error: {str(e)}",
+            "error": f"Research error: {str(e)}",
         }, ensure_ascii=False)
 
 
@@ -150,27 +464,48 @@ def extract_coordinates(
     Returns:
         Command object that updates state with coordinates and returns success/failure info
     """
-    geolocator = get_geolocator()
-
-    # Get current state
-    current_coordinates = runtime.state.get("attraction_coordinates", {})
-
-    # Process new coordinates
+    # Attractions already in state (e.g. when the agent retries after partial failures) are skipped
+    current_coordinates = runtime.state.get("attraction_coordinates") or {}
+    already_known = [name for name in attractions if name in current_coordinates]
+    if already_known:
+        LOGGER.info(f"Skipping {len(already_known)} attractions with coordinates already in state")
+        attractions = {name: address for name, address in attractions.items() if name not in current_coordinates}
+
+    # Resolve cached addresses first; only misses go through the throttled geocoder
+    cached_locations = {}
+    misses = {}
+    for original_name, address in attractions.items():
+        cached = _get_cached_geocode(original_name, address)
+        if cached is not None:
+            cached_locations[original_name] = cached
+        else:
+            misses[original_name] = address
+
+    # Geocode the misses concurrently (throttled to the provider's rate limit)
+    futures = {}
+    if misses:
+        max_workers = min(int(os.getenv("GEOCODER_MAX_WORKERS", "4")), len(misses))
+        with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                original_name: executor.submit(_geocode_address, original_name, address)
+                for original_name, address in misses.items()
+            }
+
+    # Process new coordinates (in input order, so clusters stay aligned with the user's list)
     new_coordinates = {}
     failures = []
 
     for original_name, address in attractions.items():
         try:
-            LOGGER.info(f"Geocoding '{original_name}' using address: {address}")
-            location = geolocator.geocode(address, timeout=10)
+            if original_name in cached_locations:
+                location = cached_locations[original_name]
+            else:
+                location = futures[original_name].result()
 
             if location:
                 # Store with original name as key, but geocode using address
-                new_coordinates[original_name] = {
-                    "lat": location.latitude,
-                    "lon": location.longitude
-                }
-                LOGGER.info(f"✓ Success: {original_name} -> ({location.latitude}, {location.longitude})")
+                new_coordinates[original_name] = location
+                LOGGER.info(f"✓ Success: {original_name} -> ({location['lat']}, {location['lon']})")
             else:
                 failures.append({"name": original_name, "address": address})
                 LOGGER.warning(f"✗ Failed: Could not find coordinates for '{original_name}' (address: {address})")
@@ -179,9 +514,6 @@ def extract_coordinates(
             failures.append({"name": original_name, "address": address})
             LOGGER.error(f"✗ Error geocoding '{original_name}': {e}")
 
-    # Merge new data with existing
-    attraction_coordinates = {**current_coordinates, **new_coordinates}
-
     # Check if all coordinates are obtained (no failures)
     all_coordinates_obtained = len(failures) == 0
 
@@ -190,48 +522,308 @@ def extract_coordinates(
         "failures": failures,
         "total_success": len(new_coordinates),
         "total_failures": len(failures),
-    }, ensure_ascii=False, indent=2)
+        "already_known": len(already_known),
+    }, ensure_ascii=False, separators=(",", ":"))
 
     # Return Command to update state
     return Command(
         update={
-            "attraction_coordinates": attraction_coordinates,
+            # Only the new coordinates: the merge_dicts reducer merges them into the existing ones
+            "attraction_coordinates": new_coordinates,
             "all_coordinates_obtained": all_coordinates_obtained,
             "messages": [ToolMessage(content=message_content, tool_call_id=runtime.tool_call_id)]
         }
     )
 
 
-def _calculate_centroid(coordinates: dict, names: list) -> tuple:
-    """Calculate the centroid (center point) for a list of attractions."""
-    if not names:
+# Mean Earth radius used for great-circle distances
+EARTH_RADIUS_KM = 6371.0088
+
+
+def _haversine_matrix(points: np.ndarray) -> np.ndarray:
+    """
+    Compute pairwise great-circle distances between points (vectorized).
+
+    Args:
+        points: Array of shape (N, 2) with (lat, lon) in degrees
+
+    Returns:
+        (N, N) array of distances in km
+    """
+    lat = np.radians(points[:, 0])
+    lon = np.radians(points[:, 1])
+    cos_lat = np.cos(lat)
+
+    # Haversine term, accumulated in place to limit (N, N) temporaries
+    a = np.square(np.sin(np.subtract.outer(lat, lat) * 0.5))
+    a += np.outer(cos_lat, cos_lat) * np.square(np.sin(np.subtract.outer(lon, lon) * 0.5))
+    np.clip(a, 0.0, 1.0, out=a)
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * EARTH_RADIUS_KM
+    return a
+
+
+def _project_to_km(points: np.ndarray) -> np.ndarray:
+    """
+    Project (lat, lon) points onto a local plane in km (equirectangular around their mean latitude).
+
+    K-means uses Euclidean distances, which are only meaningful in a metric space; at city
+    scale this projection is accurate to well under 1%, unlike raw degrees, where a degree
+    of longitude shrinks with latitude.
+    """
+    ref_lat = np.radians(points[:, 0].mean())
+    x = np.radians(points[:, 1]) * np.cos(ref_lat) * EARTH_RADIUS_KM
+    y = np.radians(points[:, 0]) * EARTH_RADIUS_KM
+    return np.column_stack([x, y])
+
+
+def _kmeans_small(points: np.ndarray, n_clusters: int, n_init: int = 3, max_iter: int = 20, seed: int = 42) -> np.ndarray:
+    """
+    Plain K-means (k-means++ seeding + Lloyd iterations) for trip-sized inputs.
+
+    With a few dozen 2-D points, scikit-learn's validation and dispatch overhead dwarfs
+    the actual work; this NumPy version needs no extra dependency and is reproducible
+    through a fixed seed.
+
+    Args:
+        points: (N, 2) array in a metric space (see _project_to_km)
+        n_clusters: Number of clusters (<= N)
+        n_init: Number of seeded runs; the one with the lowest inertia wins
+        max_iter: Maximum Lloyd iterations per run
+        seed: Random seed
+
+    Returns:
+        Cluster label per point
+    """
+    rng = np.random.default_rng(seed)
+    n = len(points)
+    best_labels, best_inertia = None, np.inf
+
+    for _ in range(n_init):
+        # k-means++: each new center is drawn with probability proportional to squared distance
+        centers = np.empty((n_clusters, points.shape[1]))
+        centers[0] = points[rng.integers(n)]
+        closest_sq = ((points - centers[0]) ** 2).sum(axis=1)
+        for c in range(1, n_clusters):
+            total = closest_sq.sum()
+            idx = rng.choice(n, p=closest_sq / total) if total > 0 else rng.integers(n)
+            centers[c] = points[idx]
+            closest_sq = np.minimum(closest_sq, ((points - centers[c]) ** 2).sum(axis=1))
+
+        labels = None
+        for _ in range(max_iter):
+            sq_distances = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+            new_labels = sq_distances.argmin(axis=1)
+            if labels is not None and np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+            for c in range(n_clusters):
+                members = labels == c
+                if members.any():
+                    centers[c] = points[members].mean(axis=0)
+                else:
+                    # Re-seed an empty cluster at the point farthest from its center
+                    far = int(sq_distances[np.arange(n), labels].argmax())
+                    centers[c] = points[far]
+
+        inertia = ((points - centers[labels]) ** 2).sum()
+        if inertia < best_inertia:
+            best_labels, best_inertia = labels, inertia
+
+    return best_labels
+
+
+@lru_cache(maxsize=32)
+def _fit_constrained_kmeans(points_bytes: bytes, shape: tuple, n_clusters: int, size_min: int, size_max: int) -> tuple:
+    """
+    Fit size-constrained K-means (memoized).
+
+    The fit solves a min-cost flow problem per iteration, so it is by far the slowest
+    step. When the agent re-plans with the same flexible attractions and limits (e.g. after
+    the user changes a preference for another day), the labels are reused.
+
+    Args:
+        points_bytes: Projected points (see _project_to_km) as raw float64 bytes, hashable for the cache
+        shape: Shape of the points array
+        n_clusters: Number of clusters
+        size_min: Minimum cluster size
+        size_max: Maximum cluster size
+
+    Returns:
+        Cluster label per point, as a tuple (immutable, since it is shared between callers)
+    """
+    from k_means_constrained import KMeansConstrained
+    points = np.frombuffer(points_bytes, dtype=np.float64).reshape(shape)
+    kmeans = KMeansConstrained(
+        n_clusters=n_clusters,
+        size_min=size_min,
+        size_max=size_max,
+        random_state=42
+    )
+    return tuple(int(label) for label in kmeans.fit_predict(points))
+
+
+def _rebalance_small_clusters(points: np.ndarray, labels: np.ndarray, n_clusters: int) -> np.ndarray:
+    """
+    Grow undersized K-means clusters so no day ends up with a lone attraction.
+
+    A cluster is undersized when it has fewer than half the average cluster size.
+    It takes the points nearest to its center from clusters that can spare them
+    (those above that minimum), one at a time.
+
+    Args:
+        points: Projected coordinates, shape (N, 2)
+        labels: K-means label of each point
+        n_clusters: Number of clusters
+
+    Returns:
+        Rebalanced labels
+    """
+    labels = labels.copy()
+    min_size = int(np.ceil(np.ceil(len(points) / n_clusters) / 2))
+    counts = np.bincount(labels, minlength=n_clusters)
+
+    for cid in range(n_clusters):
+        if counts[cid] >= min_size:
+            continue
+        center = points[labels == cid].mean(axis=0) if counts[cid] else points.mean(axis=0)
+        distances = np.linalg.norm(points - center, axis=1)
+
+        while counts[cid] < min_size:
+            donors = (labels != cid) & (counts[labels] > min_size)
+            if not donors.any():
+                break
+            nearest = int(np.argmin(np.where(donors, distances, np.inf)))
+            counts[labels[nearest]] -= 1
+            labels[nearest] = cid
+            counts[cid] += 1
+
+    return labels
+
+
+def _two_opt(route: list, distances: np.ndarray) -> list:
+    """
+    Shorten an open route with 2-opt segment reversals, keeping its first stop fixed.
+
+    Args:
+        route: Visiting order as indices into distances
+        distances: Pairwise distance matrix
+
+    Returns:
+        Improved visiting order
+    """
+    route = list(route)
+    last = len(route) - 1
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, last):
+            for j in range(i + 1, last + 1):
+                before = distances[route[i - 1], route[i]]
+                after = distances[route[i - 1], route[j]]
+                if j < last:
+                    before += distances[route[j], route[j + 1]]
+                    after += distances[route[i], route[j + 1]]
+                if after < before - 1e-9:
+                    route[i:j + 1] = route[i:j + 1][::-1]
+                    improved = True
+    return route
+
+
+def _route_length(route: list, distances: np.ndarray) -> float:
+    """Total length of an open route."""
+    return float(sum(distances[a, b] for a, b in zip(route, route[1:])))
+
+
+def _nearest_neighbor_route(start: int, distances: np.ndarray) -> list:
+    """Build an open route from start by always moving to the nearest unvisited point."""
+    route = [start]
+    unvisited = np.ones(len(distances), dtype=bool)
+    unvisited[start] = False
+
+    while unvisited.any():
+        candidates = np.where(unvisited, distances[route[-1]], np.inf)
+        nearest = int(np.argmin(candidates))
+        route.append(nearest)
+        unvisited[nearest] = False
+
+    return route
+
+
+def _hull_insertion_route(start: int, points: np.ndarray, distances: np.ndarray):
+    """
+    Build an open route from start by convex hull + cheapest insertion.
+
+    The closed tour starts as the convex hull of the points; each remaining point is
+    inserted where it adds the least distance. The tour is then opened at start,
+    dropping the longer of start's two edges.
+
+    Returns:
+        Route as a list of indices, or None if the hull is degenerate (too few or collinear points)
+    """
+    if len(points) < 4:
         return None
-    lats = [coordinates[name]["lat"] for name in names if name in coordinates]
-    lons = [coordinates[name]["lon"] for name in names if name in coordinates]
-    if not lats:
+
+    from scipy.spatial import ConvexHull, QhullError
+    try:
+        hull = ConvexHull(_project_to_km(points))
+    except QhullError:
         return None
-    return (sum(lats) / len(lats), sum(lons) / len(lons))
 
+    tour = [int(v) for v in hull.vertices]
+    remaining = [i for i in range(len(points)) if i not in set(tour)]
+
+    while remaining:
+        current = np.array(tour)
+        following = np.roll(current, -1)
+        # costs[edge, candidate]: detour of inserting candidate between current[edge] and following[edge]
+        costs = (
+            distances[np.ix_(current, remaining)]
+            + distances[np.ix_(following, remaining)]
+            - distances[current, following][:, None]
+        )
+        edge, candidate = np.unravel_index(int(np.argmin(costs)), costs.shape)
+        tour.insert(int(edge) + 1, remaining.pop(int(candidate)))
 
-def _order_attractions_nearest_neighbor(coordinates: dict, attractions: list, starting_point: str = None) -> list:
+    # Rotate to start, then open the cycle on the longer of start's edges
+    position = tour.index(start)
+    cycle = tour[position:] + tour[:position]
+    if distances[start, cycle[1]] > distances[start, cycle[-1]]:
+        return [start] + cycle[:0:-1]
+    return cycle
+
+
+def _order_attractions_nearest_neighbor(
+    coordinates: dict,
+    attractions: list,
+    starting_point: str = None,
+    distance_matrix: np.ndarray = None,
+) -> list:
     """
-    Order attractions using nearest-neighbor algorithm.
+    Order attractions along a short route through all of them.
 
     Algorithm:
     1. If starting_point is provided and valid, use it as the first attraction
     2. Otherwise, calculate the center (centroid) and start from the closest attraction to it
-    3. From the current attraction, go to the nearest unvisited attraction
-    4. Repeat until all attractions are visited
+    3. Build a nearest-neighbor route: from the current attraction, go to the nearest unvisited one
+    4. Build a convex hull + cheapest insertion route opened at the same first attraction
+    5. Remove crossing legs from both with 2-opt (the first attraction stays first) and keep the shorter
 
     Args:
         coordinates: Dict with {name: {lat, lon}} for each attraction
         attractions: List of attraction names to order
         starting_point: Optional attraction name to start the route from
+        distance_matrix: Optional precomputed (N, N) distances aligned with coordinates.keys(),
+                         shared across days instead of recomputing them per day
 
     Returns:
         Ordered list of attraction names
     """
-    if len(attractions) <= 1:
+    if len(attractions) <= 2:
+        # With one or two stops both orders have the same length; only the start matters
+        if starting_point in attractions:
+            return [starting_point] + [a for a in attractions if a != starting_point]
         return attractions
 
     # Filter attractions that have coordinates
@@ -239,35 +831,35 @@ def _order_attractions_nearest_neighbor(coordinates: dict, attractions: list, st
     if len(attractions_with_coords) <= 1:
         return attractions
 
-    def distance_to_point(name, point):
-        coord = (coordinates[name]["lat"], coordinates[name]["lon"])
-        return geodesic(coord, point).km
+    points = np.array([(coordinates[a]["lat"], coordinates[a]["lon"]) for a in attractions_with_coords])
 
     # Determine starting point
     if starting_point and starting_point in attractions_with_coords:
         # User specified a valid starting point
-        first_attraction = starting_point
+        start = attractions_with_coords.index(starting_point)
         LOGGER.info(f"Using user-specified starting point: {starting_point}")
     else:
         # Default: find attraction closest to centroid
-        centroid = _calculate_centroid(coordinates, attractions_with_coords)
-        if not centroid:
-            return attractions
-        first_attraction = min(attractions_with_coords, key=lambda a: distance_to_point(a, centroid))
-        LOGGER.info(f"Using centroid-based starting point: {first_attraction}")
-
-    # Nearest-neighbor traversal
-    ordered = [first_attraction]
-    remaining = set(attractions_with_coords) - {first_attraction}
-
-    while remaining:
-        current = ordered[-1]
-        current_coord = (coordinates[current]["lat"], coordinates[current]["lon"])
+        centroid = points.mean(axis=0)
+        start = int(np.argmin(_haversine_matrix(np.vstack([points, centroid]))[-1, :-1]))
+        LOGGER.info(f"Using centroid-based starting point: {attractions_with_coords[start]}")
+
+    # Nearest-neighbor traversal over the pairwise distance matrix
+    if distance_matrix is not None:
+        positions = {name: i for i, name in enumerate(coordinates)}
+        indices = [positions[a] for a in attractions_with_coords]
+        distances = distance_matrix[np.ix_(indices, indices)]
+    else:
+        distances = _haversine_matrix(points)
+    # Two seeds (nearest-neighbor and convex hull insertion), both polished with 2-opt; keep the shorter
+    route = _two_opt(_nearest_neighbor_route(start, distances), distances)
+    hull_route = _hull_insertion_route(start, points, distances)
+    if hull_route is not None:
+        hull_route = _two_opt(hull_route, distances)
+        if _route_length(hull_route, distances) < _route_length(route, distances) - 1e-9:
+            route = hull_route
 
-        # Find nearest unvisited attraction
-        nearest = min(remaining, key=lambda a: distance_to_point(a, current_coord))
-        ordered.append(nearest)
-        remaining.remove(nearest)
+    ordered = [attractions_with_coords[index] for index in route]
 
     # Add any attractions without coordinates at the end
     attractions_without_coords = [a for a in attractions if a not in coordinates]
@@ -288,6 +880,326 @@ def _validate_day_assignments(assignments: dict, num_days: int, param_name: str)
     return True, ""
 
 
+@traceable(name="organize_attractions", run_type="chain")
+def _organize_attractions(
+    coordinates: dict,
+    num_days: int,
+    prefs: dict,
+    isolated: dict,
+    optimize_order_by_distance: bool,
+    starting_point: str,
+    min_attractions_per_day: int,
+    max_attractions_per_day: int,
+) -> dict:
+    """
+    Compute the day organization for the given coordinates and constraints.
+
+    Pure and deterministic for a given input, so results can be memoized.
+
+    Returns:
+        {"error": message} on invalid input, otherwise a dict with
+        "clusters" (list of 0-indexed days aligned with coordinates.keys()),
+        "organized_days", "has_flexible_attractions" and "response" (tool message payload).
+    """
+    attraction_names = list(coordinates.keys())
+    # (lat, lon) per attraction, aligned with attraction_names
+    points = np.array([[coordinates[n]["lat"], coordinates[n]["lon"]] for n in attraction_names], dtype=float).reshape(-1, 2)
+
+    # Validate day numbers are integers and within range [1, num_days]
+    valid, error_msg = _validate_day_assignments(prefs, num_days, "day_preferences")
+    if not valid:
+        return {"error": error_msg}
+
+    valid, error_msg = _validate_day_assignments(isolated, num_days, "isolated_days")
+    if not valid:
+        return {"error": error_msg}
+
+    # Validate min/max attractions per day
+    if min_attractions_per_day is not None and min_attractions_per_day < 1:
+        return {"error": "min_attractions_per_day must be >= 1"}
+
+    if max_attractions_per_day is not None and max_attractions_per_day < 1:
+        return {"error": "max_attractions_per_day must be >= 1"}
+
+    if (min_attractions_per_day is not None and max_attractions_per_day is not None
+            and min_attractions_per_day > max_attractions_per_day):
+        return {
+            "error": f"min_attractions_per_day ({min_attractions_per_day}) cannot be greater than max_attractions_per_day ({max_attractions_per_day})"
+        }
+
+    # Validate attractions have coordinates
+    all_defined = {**prefs, **isolated}
+    attractions_without_coords = [n for n in all_defined.keys() if n not in coordinates]
+    if attractions_without_coords:
+        return {"error": f"Attractions without coordinates: {attractions_without_coords}. Check the names."}
+
+    # Identify attraction groups (isolated takes precedence over prefs)
+    isolated_attractions = {n: d for n, d in isolated.items() if n in coordinates}
+    attractions_with_pref = {n: d for n, d in prefs.items() if n in coordinates and n not in isolated_attractions}
+    flexible_attractions = [n for n in attraction_names if n not in isolated_attractions and n not in attractions_with_pref]
+
+    LOGGER.info(f"Organizing: {len(isolated_attractions)} isolated, {len(attractions_with_pref)} with preference, {len(flexible_attractions)} flexible, {num_days} days")
+
+    # Days reserved for isolated attractions (no other attractions allowed)
+    reserved_days = set(isolated_attractions.values())
+
+    # Validate preferences don't target reserved days
+    prefs_on_reserved_days = {n: d for n, d in attractions_with_pref.items() if d in reserved_days}
+    if prefs_on_reserved_days:
+        return {
+            "error": f"Conflict: preferences point to isolated days. "
+                     f"Attractions {list(prefs_on_reserved_days.keys())} want days {list(prefs_on_reserved_days.values())} "
+                     f"but those days are reserved for isolated attractions."
+        }
+
+    days_for_kmeans = [d for d in range(1, num_days + 1) if d not in reserved_days]
+
+    # SCENARIO 1: All attractions have assigned days (all in prefs or isolated)
+    if len(flexible_attractions) == 0:
+        LOGGER.info(f"Scenario: All attractions have defined days (optimize_order_by_distance={optimize_order_by_distance})")
+        # IMPORTANT: clusters must be aligned with attraction_names order (from coordinates.keys())
+        # because the map visualization uses coordinates.keys() to iterate
+        clusters = [all_defined.get(n, 1) - 1 for n in attraction_names]
+
+        # Group by day - preserve user's order from preferences (all_defined.keys())
+        result_by_day_unordered = {}
+        for n in all_defined.keys():
+            day = all_defined.get(n, 1)
+            result_by_day_unordered.setdefault(f"day_{day}", []).append(n)
+
+        # Optionally optimize order within each day by distance
+        if optimize_order_by_distance:
+            distance_matrix = _haversine_matrix(points)
+            result_by_day = {}
+            for day_key, attractions in result_by_day_unordered.items():
+                # Only pass starting_point if it's in this day's attractions
+                day_starting_point = starting_point if starting_point in attractions else None
+                result_by_day[day_key] = _order_attractions_nearest_neighbor(
+                    coordinates, attractions, day_starting_point, distance_matrix
+                )
+            mode_message = "Days predefined by user, order optimized by distance within each day."
+            if starting_point:
+                mode_message += f" Starting from: {starting_point}."
+        else:
+            result_by_day = result_by_day_unordered
+            mode_message = "User organization maintained."
+
+        return {
+            "clusters": clusters,
+            "organized_days": result_by_day,
+            "has_flexible_attractions": False,  # All predefined, no approval needed
+            "response": {
+                "mode": "predefined",
+                "optimized_by_distance": optimize_order_by_distance,
+                "starting_point": starting_point,
+                "message": mode_message,
+                "days": result_by_day
+            },
+        }
+
+    # SCENARIO 2: K-means clustering for flexible attractions only
+    # Preferences are ABSOLUTE - they go directly to their day, not through K-means
+    LOGGER.info(f"K-means on {len(flexible_attractions)} flexible attractions for {len(days_for_kmeans)} days")
+
+    # Check if we have days available for flexible attractions
+    # Days used by preferences (but not exclusive, so K-means can add more)
+    days_with_pref = set(attractions_with_pref.values())
+    # Days that are truly free (no isolated, no pref)
+    free_days = [d for d in days_for_kmeans if d not in days_with_pref]
+
+    # Total "slots" for K-means = days with prefs (can add more) + free days
+    days_for_flex = list(days_with_pref) + free_days
+
+    if not days_for_flex and flexible_attractions:
+        return {"error": "No days available to group flexible attractions."}
+
+    # Build final clusters array
+    clusters = np.zeros(len(attraction_names), dtype=int)
+
+    # First, assign isolated attractions to their exclusive days
+    # Second, assign attractions with preferences to their preferred days (ABSOLUTE)
+    for idx, name in enumerate(attraction_names):
+        if name in isolated_attractions:
+            clusters[idx] = isolated_attractions[name] - 1
+        elif name in attractions_with_pref:
+            clusters[idx] = attractions_with_pref[name] - 1
+
+    # Third, K-means for flexible attractions
+    if flexible_attractions:
+        positions = {name: idx for idx, name in enumerate(attraction_names)}
+        flex_indices = np.array([positions[n] for n in flexible_attractions], dtype=int)
+        coords_flex = points[flex_indices]
+        n_clusters_flex = min(len(days_for_flex), len(flexible_attractions))
+
+        if n_clusters_flex > 0:
+            # Use constrained K-means if min/max constraints are provided
+            use_constrained = min_attractions_per_day is not None or max_attractions_per_day is not None
+
+            if use_constrained:
+                # Calculate size constraints
+                size_min = min_attractions_per_day if min_attractions_per_day else 0
+                size_max = max_attractions_per_day if max_attractions_per_day else len(flexible_attractions)
+
+                # Validate constraints are feasible
+                total_attractions = len(flexible_attractions)
+                min_possible = size_min * n_clusters_flex
+                max_possible = size_max * n_clusters_flex
+
+                if min_possible > total_attractions:
+                    return {
+                        "error": f"Impossible constraint: min_attractions_per_day={size_min} with {n_clusters_flex} days requires at least {min_possible} attractions, but only {total_attractions} are available."
+                    }
+
+                if max_possible < total_attractions:
+                    return {
+                        "error": f"Impossible constraint: max_attractions_per_day={size_max} with {n_clusters_flex} days can only fit {max_possible} attractions, but {total_attractions} need to be assigned."
+                    }
+
+            projected_flex = _project_to_km(coords_flex)
+
+            if use_constrained:
+                LOGGER.info(f"Using constrained K-means: size_min={size_min}, size_max={size_max}")
+                clusters_flex = np.array(_fit_constrained_kmeans(
+                    projected_flex.tobytes(), projected_flex.shape, n_clusters_flex, size_min, size_max
+                ))
+            else:
+                clusters_flex = _kmeans_small(projected_flex, n_clusters_flex)
+                # Size constraints already bound constrained K-means; otherwise avoid near-empty days
+                clusters_flex = _rebalance_small_clusters(projected_flex, clusters_flex, n_clusters_flex)
+
+            # Cluster centers in (lat, lon), as mean position of each cluster's attractions
+            cluster_centers = np.array([
+                coords_flex[clusters_flex == cid].mean(axis=0) if np.any(clusters_flex == cid) else coords_flex.mean(axis=0)
+                for cid in range(n_clusters_flex)
+            ])
+
+            # Map K-means clusters to available days
+            # Prioritize days that already have preferences (to group nearby attractions)
+            cluster_to_day = {}
+
+            if attractions_with_pref:
+                # Calculate centroid of each preference day
+                indices_by_pref_day = defaultdict(list)
+                for name, day in attractions_with_pref.items():
+                    if name in positions:
+                        indices_by_pref_day[day].append(positions[name])
+                pref_centroids = {
+                    day: points[indices_by_pref_day[day]].mean(axis=0)
+                    for day in days_with_pref
+                    if indices_by_pref_day.get(day)
+                }
+
+                pref_days = list(pref_centroids)
+                assigned_clusters = set()
+                assigned_days = set()
+
+                # First pass: match clusters to preference days minimizing the total center
+                # distance (optimal, unlike picking the nearest cluster day by day)
+                if pref_days:
+                    from scipy.optimize import linear_sum_assignment
+                    # Distances from each preference day centroid to each K-means cluster center
+                    all_centers = np.vstack([np.array([pref_centroids[d] for d in pref_days]), cluster_centers])
+                    center_distances = _haversine_matrix(all_centers)[:len(pref_days), len(pref_days):]
+                    for row, cid in zip(*linear_sum_assignment(center_distances)):
+                        day = pref_days[row]
+                        cluster_to_day[int(cid)] = day
+                        assigned_clusters.add(int(cid))
+                        assigned_days.add(day)
+
+                # Second pass: assign remaining clusters to free days
+                for cid in range(n_clusters_flex):
+                    if cid not in assigned_clusters:
+                        for day in free_days:
+                            if day not in assigned_days:
+                                cluster_to_day[cid] = day
+                                assigned_days.add(day)
+                                break
+                        else:
+                            # Fallback: use any available day from days_for_flex
+                            for day in days_for_flex:
+                                if day not in assigned_days:
+                                    cluster_to_day[cid] = day
+                                    assigned_days.add(day)
+                                    break
+            else:
+                # No preferences, just map clusters to available days
+                for i, day in enumerate(days_for_flex[:n_clusters_flex]):
+                    cluster_to_day[i] = day
+
+            # Assign flexible attractions based on K-means results (one lookup table per cluster)
+            default_day = days_for_flex[0] if days_for_flex else 1
+            day_of_cluster = np.array([cluster_to_day.get(cid, default_day) for cid in range(n_clusters_flex)], dtype=int)
+            clusters[flex_indices] = day_of_cluster[clusters_flex] - 1
+
+    # Build result grouped by day (unordered first)
+    result_by_day_unordered = {}
+    for idx, name in enumerate(attraction_names):
+        day = int(clusters[idx]) + 1
+        result_by_day_unordered.setdefault(f"day_{day}", []).append(name)
+
+    # Order attractions within each day using nearest-neighbor from center
+    # (pairwise distances are computed once for all days)
+    distance_matrix = _haversine_matrix(points)
+    result_by_day = {}
+    for day_key, attractions in result_by_day_unordered.items():
+        # Only pass starting_point if it's in this day's attractions
+        day_starting_point = starting_point if starting_point in attractions else None
+        result_by_day[day_key] = _order_attractions_nearest_neighbor(
+            coordinates, attractions, day_starting_point, distance_matrix
+        )
+
+    message = "Attractions organized by geographic proximity. The order within each day is already optimized to minimize travel."
+    if starting_point:
+        message += f" Starting from: {starting_point}."
+    if min_attractions_per_day:
+        message += f" Minimum {min_attractions_per_day} attractions per day enforced."
+    if max_attractions_per_day:
+        message += f" Maximum {max_attractions_per_day} attractions per day enforced."
+
+    return {
+        "clusters": clusters.tolist(),
+        "organized_days": result_by_day,
+        "has_flexible_attractions": True,  # K-means was used, approval needed
+        "response": {
+            "mode": "kmeans" if not isolated_attractions and not attractions_with_pref else "mixed",
+            "message": message,
+            "isolated_days": sorted(reserved_days) if reserved_days else None,
+            "starting_point": starting_point,
+            "min_attractions_per_day": min_attractions_per_day,
+            "max_attractions_per_day": max_attractions_per_day,
+            "days": result_by_day,
+        },
+    }
+
+
+def _get_organization(organization_key: str, compute) -> dict:
+    """
+    Return the organization for a key, checking the in-process cache, then the disk cache.
+
+    Only successful organizations are cached; errors are always recomputed.
+    """
+    global _organization_disk_cache
+
+    if organization_key in _organization_cache:
+        LOGGER.info(f"Organization cache hit (memory): {organization_key}")
+        return _organization_cache[organization_key]
+
+    if _organization_disk_cache is None:
+        _organization_disk_cache = DiskCache("organization")
+
+    organization = _organization_disk_cache.get(organization_key)
+    if organization is not None:
+        LOGGER.info(f"Organization cache hit (disk): {organization_key}")
+        _organization_cache[organization_key] = organization
+        return organization
+
+    organization = compute()
+    if "error" not in organization:
+        _organization_cache[organization_key] = organization
+        _organization_disk_cache.set(organization_key, organization)
+    return organization
+
+
 @tool
 def organize_attractions_by_days(
     runtime: ToolRuntime,
@@ -319,24 +1231,28 @@ def organize_attractions_by_days(
 
         optimize_order_by_distance: If True, optimize the order of attractions within each day
                                     by geographic proximity (nearest-neighbor algorithm).
-                                    Useful when user specifies all days but wants distance optimization.
+                                    Useful when user specifies all days but wants distance optimization,
+                                    e.g. "organize by shortest distance", "minimize travel", "optimize route".
                                     Default: False (preserve user's order when all days are predefined).
 
         starting_point: Optional attraction name to start the route from when optimizing by distance.
                         Must be one of the attractions in the coordinates.
                         Only used when optimize_order_by_distance=True.
+                        Use when the user says "start from X", "begin at X", "X will be my first stop".
                         Example: "Eiffel Tower, Paris" - start the optimized route from Eiffel Tower.
 
         min_attractions_per_day: Optional minimum number of attractions per day (for flexible attractions).
                                  Uses constrained K-means to ensure each cluster has at least this many members.
                                  The number of days/clusters remains unchanged.
                                  Example: min_attractions_per_day=2 ensures no day has fewer than 2 attractions.
+                                 Use when the user says "at least X per day", "I want full days", "no less than X".
                                  Note: Only applies to flexible attractions, not isolated days or preferences.
 
         max_attractions_per_day: Optional maximum number of attractions per day (for flexible attractions).
                                  Uses constrained K-means to ensure each cluster has at most this many members.
                                  The number of days/clusters remains unchanged.
                                  Example: max_attractions_per_day=4 ensures no day has more than 4 attractions.
+                                 Use when the user says "no more than X per day", "max X per day", "I want relaxed days".
                                  Note: Only applies to flexible attractions, not isolated days or preferences.
 
     Returns:
@@ -363,320 +1279,44 @@ def organize_attractions_by_days(
                 )]
             })
 
-        attraction_names = list(coordinates.keys())
         prefs = day_preferences or {}
         isolated = isolated_days or {}
 
-        # Validate day numbers are integers and within range [1, num_days]
-        valid, error_msg = _validate_day_assignments(prefs, num_days, "day_preferences")
-        if not valid:
-            return Command(update={
-                "messages": [ToolMessage(
-                    json.dumps({"error": error_msg}, ensure_ascii=False),
-                    tool_call_id=runtime.tool_call_id
-                )]
-            })
-
-        valid, error_msg = _validate_day_assignments(isolated, num_days, "isolated_days")
-        if not valid:
-            return Command(update={
-                "messages": [ToolMessage(
-                    json.dumps({"error": error_msg}, ensure_ascii=False),
-                    tool_call_id=runtime.tool_call_id
-                )]
-            })
-
-        # Validate min/max attractions per day
-        if min_attractions_per_day is not None and min_attractions_per_day < 1:
-            return Command(update={
-                "messages": [ToolMessage(
-                    json.dumps({"error": "min_attractions_per_day must be >= 1"}, ensure_ascii=False),
-                    tool_call_id=runtime.tool_call_id
-                )]
-            })
-
-        if max_attractions_per_day is not None and max_attractions_per_day < 1:
-            return Command(update={
-                "messages": [ToolMessage(
-                    json.dumps({"error": "max_attractions_per_day must be >= 1"}, ensure_ascii=False),
-                    tool_call_id=runtime.tool_call_id
-                )]
-            })
-
-        if (min_attractions_per_day is not None and max_attractions_per_day is not None
-                and min_attractions_per_day > max_attractions_per_day):
-            return Command(update={
-                "messages": [ToolMessage(
-                    json.dumps({
-                        "error": f"min_attractions_per_day ({min_attractions_per_day}) cannot be greater than max_attractions_per_day ({max_attractions_per_day})"
-                    }, ensure_ascii=False),
-                    tool_call_id=runtime.tool_call_id
-                )]
-            })
-
-        # Validate attractions have coordinates
-        all_defined = {**prefs, **isolated}
-        attractions_without_coords = [n for n in all_defined.keys() if n not in coordinates]
-        if attractions_without_coords:
-            return Command(update={
-                "messages": [ToolMessage(
-                    json.dumps({"error": f"Attractions without coordinates: {attractions_without_coords}. Check the names."}, ensure_ascii=False),
-                    tool_call_id=runtime.tool_call_id
-                )]
-            })
-
-        # Identify attraction groups (isolated takes precedence over prefs)
-        isolated_attractions = {n: d for n, d in isolated.items() if n in coordinates}
-        attractions_with_pref = {n: d for n, d in prefs.items() if n in coordinates and n not in isolated_attractions}
-        flexible_attractions = [n for n in attraction_names if n not in isolated_attractions and n not in attractions_with_pref]
-
-        LOGGER.info(f"Organizing: {len(isolated_attractions)} isolated, {len(attractions_with_pref)} with preference, {len(flexible_attractions)} flexible, {num_days} days")
-
-        # Days reserved for isolated attractions (no other attractions allowed)
-        reserved_days = set(isolated_attractions.values())
-
-        # Validate preferences don't target reserved days
-        prefs_on_reserved_days = {n: d for n, d in attractions_with_pref.items() if d in reserved_days}
-        if prefs_on_reserved_days:
-            return Command(update={
-                "messages": [ToolMessage(
-                    json.dumps({
-                        "error": f"Conflict: preferences point to isolated days. "
-                                 f"Attractions {list(prefs_on_reserved_days.keys())} want days {list(prefs_on_reserved_days.values())} "
-                                 f"but those days are reserved for isolated attractions."
-                    }, ensure_ascii=False),
-                    tool_call_id=runtime.tool_call_id
-                )]
-            })
-
-        days_for_kmeans = [d for d in range(1, num_days + 1) if d not in reserved_days]
-
-        # SCENARIO 1: All attractions have assigned days (all in prefs or isolated)
-        if len(flexible_attractions) == 0:
-            LOGGER.info(f"Scenario: All attractions have defined days (optimize_order_by_distance={optimize_order_by_distance})")
-            # IMPORTANT: clusters must be aligned with attraction_names order (from coordinates.keys())
-            # because the map visualization uses coordinates.keys() to iterate
-            clusters = np.array([all_defined.get(n, 1) - 1 for n in attraction_names])
-
-            # Group by day - preserve user's order from preferences (all_defined.keys())
-            result_by_day_unordered = {}
-            for n in all_defined.keys():
-                day = all_defined.get(n, 1)
-                result_by_day_unordered.setdefault(f"day_{day}", []).append(n)
-
-            # Optionally optimize order within each day by distance
-            if optimize_order_by_distance:
-                result_by_day = {}
-                for day_key, attractions in result_by_day_unordered.items():
-                    # Only pass starting_point if it's in this day's attractions
-                    day_starting_point = starting_point if starting_point in attractions else None
-                    result_by_day[day_key] = _order_attractions_nearest_neighbor(coordinates, attractions, day_starting_point)
-                mode_message = "Days predefined by user, order optimized by distance within each day."
-                if starting_point:
-                    mode_message += f" Starting from: {starting_point}."
-            else:
-                result_by_day = result_by_day_unordered
-                mode_message = "User organization maintained."
-
-            return Command(update={
-                "clusters": clusters,
-                "organized_days": result_by_day,
-                "has_flexible_attractions": False,  # All predefined, no approval needed
-                "messages": [ToolMessage(
-                    json.dumps({
-                        "mode": "predefined",
-                        "optimized_by_distance": optimize_order_by_distance,
-                        "starting_point": starting_point,
-                        "message": mode_message,
-                        "days": result_by_day
-                    }, ensure_ascii=False, indent=2),
-                    tool_call_id=runtime.tool_call_id
-                )]
-            })
-
-        # SCENARIO 2: K-means clustering for flexible attractions only
-        # Preferences are ABSOLUTE - they go directly to their day, not through K-means
-        LOGGER.info(f"K-means on {len(flexible_attractions)} flexible attractions for {len(days_for_kmeans)} days")
-
-        # Check if we have days available for flexible attractions
-        # Days used by preferences (but not exclusive, so K-means can add more)
-        days_with_pref = set(attractions_with_pref.values())
-        # Days that are truly free (no isolated, no pref)
-        free_days = [d for d in days_for_kmeans if d not in days_with_pref]
+        # Coordinates are keyed in insertion order (clusters align with it), so they are not sorted
+        organization_key = make_cache_key({
+            "version": ORGANIZATION_ALGORITHM_VERSION,
+            "coordinates": list(coordinates.items()),
+            "num_days": num_days,
+            "day_preferences": sorted(prefs.items()),
+            "isolated_days": sorted(isolated.items()),
+            "optimize_order_by_distance": optimize_order_by_distance,
+            "starting_point": starting_point,
+            "min_attractions_per_day": min_attractions_per_day,
+            "max_attractions_per_day": max_attractions_per_day,
+        })
 
-        # Total "slots" for K-means = days with prefs (can add more) + free days
-        days_for_flex = list(days_with_pref) + free_days
+        organization = _get_organization(
+            organization_key,
+            lambda: _organize_attractions(
+                coordinates, num_days, prefs, isolated, optimize_order_by_distance,
+                starting_point, min_attractions_per_day, max_attractions_per_day,
+            ),
+        )
 
-        if not days_for_flex and flexible_attractions:
+        if "error" in organization:
             return Command(update={
                 "messages": [ToolMessage(
-                    json.dumps({"error": "No days available to group flexible attractions."}, ensure_ascii=False),
+                    json.dumps({"error": organization["error"]}, ensure_ascii=False),
                     tool_call_id=runtime.tool_call_id
                 )]
             })
 
-        # Build final clusters array
-        clusters = np.zeros(len(attraction_names), dtype=int)
-
-        # First, assign isolated attractions to their exclusive days
-        for idx, name in enumerate(attraction_names):
-            if name in isolated_attractions:
-                clusters[idx] = isolated_attractions[name] - 1
-
-        # Second, assign attractions with preferences to their preferred days (ABSOLUTE)
-        for idx, name in enumerate(attraction_names):
-            if name in attractions_with_pref:
-                clusters[idx] = attractions_with_pref[name] - 1
-
-        # Third, K-means for flexible attractions
-        if flexible_attractions:
-            coords_flex = np.array([[coordinates[n]["lat"], coordinates[n]["lon"]] for n in flexible_attractions])
-            n_clusters_flex = min(len(days_for_flex), len(flexible_attractions))
-
-            if n_clusters_flex > 0:
-                # Use constrained K-means if min/max constraints are provided
-                use_constrained = min_attractions_per_day is not None or max_attractions_per_day is not None
-
-                if use_constrained:
-                    # Calculate size constraints
-                    size_min = min_attractions_per_day if min_attractions_per_day else 0
-                    size_max = max_attractions_per_day if max_attractions_per_day else len(flexible_attractions)
-
-                    # Validate constraints are feasible
-                    total_attractions = len(flexible_attractions)
-                    min_possible = size_min * n_clusters_flex
-                    max_possible = size_max * n_clusters_flex
-
-                    if min_possible > total_attractions:
-                        return Command(update={
-                            "messages": [ToolMessage(
-                                json.dumps({
-                                    "error": f"Impossible constraint: min_attractions_per_day={size_min} with {n_clusters_flex} days requires at least {min_possible} attractions, but only {total_attractions} are available."
-                                }, ensure_ascii=False),
-                                tool_call_id=runtime.tool_call_id
-                            )]
-                        })
-
-                    if max_possible < total_attractions:
-                        return Command(update={
-                            "messages": [ToolMessage(
-                                json.dumps({
-                                    "error": f"Impossible constraint: max_attractions_per_day={size_max} with {n_clusters_flex} days can only fit {max_possible} attractions, but {total_attractions} need to be assigned."
-                                }, ensure_ascii=False),
-                                tool_call_id=runtime.tool_call_id
-                            )]
-                        })
-
-                    LOGGER.info(f"Using constrained K-means: size_min={size_min}, size_max={size_max}")
-                    kmeans = KMeansConstrained(
-                        n_clusters=n_clusters_flex,
-                        size_min=size_min,
-                        size_max=size_max,
-                        random_state=42
-                    )
-                else:
-                    kmeans = KMeans(n_clusters=n_clusters_flex, random_state=42, n_init=10)
-
-                clusters_flex = kmeans.fit_predict(coords_flex)
-
-                # Map K-means clusters to available days
-                # Prioritize days that already have preferences (to group nearby attractions)
-                cluster_to_day = {}
-
-                if attractions_with_pref:
-                    # Calculate centroid of each preference day
-                    pref_centroids = {}
-                    for day in days_with_pref:
-                        attractions_on_day = [n for n, d in attractions_with_pref.items() if d == day]
-                        centroid = _calculate_centroid(coordinates, attractions_on_day)
-                        if centroid:
-                            pref_centroids[day] = centroid
-
-                    # Calculate K-means cluster centers
-                    kmeans_centers = {i: (kmeans.cluster_centers_[i][0], kmeans.cluster_centers_[i][1])
-                                      for i in range(n_clusters_flex)}
-
-                    # Greedy assignment: match clusters to nearest preference day or free day
-                    assigned_clusters = set()
-                    assigned_days = set()
-
-                    # First pass: assign clusters to preference days by proximity
-                    for day, pref_center in pref_centroids.items():
-                        best_cluster = None
-                        best_dist = float('inf')
-                        for cid, center in kmeans_centers.items():
-                            if cid not in assigned_clusters:
-                                dist = geodesic(pref_center, center).km
-                                if dist < best_dist:
-                                    best_dist = dist
-                                    best_cluster = cid
-                        if best_cluster is not None:
-                            cluster_to_day[best_cluster] = day
-                            assigned_clusters.add(best_cluster)
-                            assigned_days.add(day)
-
-                    # Second pass: assign remaining clusters to free days
-                    for cid in range(n_clusters_flex):
-                        if cid not in assigned_clusters:
-                            for day in free_days:
-                                if day not in assigned_days:
-                                    cluster_to_day[cid] = day
-                                    assigned_days.add(day)
-                                    break
-                            else:
-                                # Fallback: use any available day from days_for_flex
-                                for day in days_for_flex:
-                                    if day not in assigned_days:
-                                        cluster_to_day[cid] = day
-                                        assigned_days.add(day)
-                                        break
-                else:
-                    # No preferences, just map clusters to available days
-                    for i, day in enumerate(days_for_flex[:n_clusters_flex]):
-                        cluster_to_day[i] = day
-
-                # Assign flexible attractions based on K-means results
-                for flex_idx, name in enumerate(flexible_attractions):
-                    cid = clusters_flex[flex_idx]
-                    day = cluster_to_day.get(cid, days_for_flex[0] if days_for_flex else 1)
-                    name_idx = attraction_names.index(name)
-                    clusters[name_idx] = day - 1
-
-        # Build result grouped by day (unordered first)
-        result_by_day_unordered = {}
-        for idx, name in enumerate(attraction_names):
-            day = clusters[idx] + 1
-            result_by_day_unordered.setdefault(f"day_{day}", []).append(name)
-
-        # Order attractions within each day using nearest-neighbor from center
-        result_by_day = {}
-        for day_key, attractions in result_by_day_unordered.items():
-            # Only pass starting_point if it's in this day's attractions
-            day_starting_point = starting_point if starting_point in attractions else None
-            result_by_day[day_key] = _order_attractions_nearest_neighbor(coordinates, attractions, day_starting_point)
-
-        message = "Attractions organized by geographic proximity. The order within each day is already optimized to minimize travel."
-        if starting_point:
-            message += f" Starting from: {starting_point}."
-        if min_attractions_per_day:
-            message += f" Minimum {min_attractions_per_day} attractions per day enforced."
-        if max_attractions_per_day:
-            message += f" Maximum {max_attractions_per_day} attractions per day enforced."
-
         return Command(update={
-            "clusters": clusters,
-            "organized_days": result_by_day,
-            "has_flexible_attractions": True,  # K-means was used, approval needed
+            "clusters": np.array(organization["clusters"], dtype=np.int16),
+            "organized_days": organization["organized_days"],
+            "has_flexible_attractions": organization["has_flexible_attractions"],
             "messages": [ToolMessage(
-                json.dumps({
-                    "mode": "kmeans" if not isolated_attractions and not attractions_with_pref else "mixed",
-                    "message": message,
-                    "isolated_days": list(reserved_days) if reserved_days else None,
-                    "starting_point": starting_point,
-                    "min_attractions_per_day": min_attractions_per_day,
-                    "max_attractions_per_day": max_attractions_per_day,
-                    "days": result_by_day,
-                }, ensure_ascii=False, indent=2),
+                json.dumps(organization["response"], ensure_ascii=False, separators=(",", ":")),
                 tool_call_id=runtime.tool_call_id
             )]
         })
@@ -723,7 +1363,7 @@ def return_invalid_input_error(
             json.dumps({
                 "status": "invalid_input",
                 "message": message
-            }, ensure_ascii=False, indent=2),
+            }, ensure_ascii=False, separators=(",", ":")),
             tool_call_id=runtime.tool_call_id
         )]
     })
@@ -796,7 +1436,7 @@ def request_itinerary_approval(
                 json.dumps({
                     "approved": True,
                     "message": "User approved the itinerary. Proceed with document generation."
-                }, ensure_ascii=False, indent=2),
+                }, ensure_ascii=False, separators=(",", ":")),
                 tool_call_id=runtime.tool_call_id
             )]
         })
@@ -810,7 +1450,7 @@ def request_itinerary_approval(
                     "approved": False,
                     "feedback": str(user_response),
                     "message": "User requested changes. Use update_itinerary_organization to apply the changes, then call request_itinerary_approval again."
-                }, ensure_ascii=False, indent=2),
+                }, ensure_ascii=False, separators=(",", ":")),
                 tool_call_id=runtime.tool_call_id
             )]
         })
@@ -874,13 +1514,13 @@ def update_itinerary_organization(
         })
 
     # Recalculate clusters based on new organization
-    clusters = np.zeros(len(attraction_names), dtype=int)
+    positions = {name: idx for idx, name in enumerate(attraction_names)}
+    clusters = np.zeros(len(attraction_names), dtype=np.int16)
     for day_key, attractions in new_organized_days.items():
         day_num = int(day_key.split("_")[1]) - 1  # 0-indexed
         for attraction in attractions:
-            if attraction in attraction_names:
-                idx = attraction_names.index(attraction)
-                clusters[idx] = day_num
+            if attraction in positions:
+                clusters[positions[attraction]] = day_num
 
     LOGGER.info(f"Updated itinerary organization: {new_organized_days}")
 
@@ -892,7 +1532,7 @@ def update_itinerary_organization(
                 "success": True,
                 "message": "Itinerary organization updated. Call request_itinerary_approval to get user confirmation.",
                 "days": new_organized_days
-            }, ensure_ascii=False, indent=2),
+            }, ensure_ascii=False, separators=(",", ":")),
             tool_call_id=runtime.tool_call_id
         )]
     })
@@ -914,6 +1554,5 @@ DAY_ORGANIZER_TOOLS = [
 
 # Second agent (attraction researcher) - needs search and images
 ATTRACTION_RESEARCHER_TOOLS = [
-    search_attraction_info,
-    search_attraction_images,
+    research_location,
 ]
@@ -8,15 +8,68 @@ Available tools:
 - tavily-search: Real-time web search with filtering options
 """
 import os
+import re
 import json
 import asyncio
+import threading
 from typing import Optional, Dict, Any
 from src.utils.logger import LOGGER
+from src.utils.rate_limiter import TokenBucket
 
 # MCP imports
 from mcp import ClientSession
 from mcp.client.streamable_http import streamable_http_client
 
+# Rate limiter shared across all client instances and worker threads (created on first use)
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket:
+    """
+    Get or create the Tavily request rate limiter.
+
+    TAVILY_REQUESTS_PER_MINUTE defaults to Tavily's development key limit.
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = TokenBucket(
+                rate=float(os.getenv("TAVILY_REQUESTS_PER_MINUTE", "100")) / 60,
+                burst=int(os.getenv("TAVILY_BURST", "5")),
+            )
+    return _rate_limiter
+
+
+_RETRY_AFTER_PATTERN = re.compile(r"retry[- _]after\D{0,10}?(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+
+def _rate_limit_delay(error: Any) -> Optional[float]:
+    """
+    Return how long to back off if an error is a rate-limit rejection, else None.
+
+    MCP hides the HTTP response, so the Retry-After value is taken from the response
+    headers when the error carries them, or from the error text otherwise. Without an
+    explicit value, TAVILY_RATE_LIMIT_COOLDOWN_SECONDS (default: 10) is used.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    status = getattr(response, "status_code", None)
+    text = str(error)
+
+    if status != 429 and "429" not in text and "rate limit" not in text.lower():
+        return None
+
+    retry_after = headers.get("Retry-After")
+    if retry_after is None:
+        match = _RETRY_AFTER_PATTERN.search(text)
+        retry_after = match.group(1) if match else None
+
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return float(os.getenv("TAVILY_RATE_LIMIT_COOLDOWN_SECONDS", "10"))
+
 
 class TavilyMCPClient:
     """
@@ -27,6 +80,9 @@ class TavilyMCPClient:
 
     REMOTE_SERVER_URL = "https://mcp.tavily.com/mcp/?tavilyApiKey={api_key}"
 
+    # Retries after a rate-limit rejection (each waits out the server's Retry-After)
+    RATE_LIMIT_RETRIES = 2
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Tavily MCP client.
@@ -135,7 +191,26 @@ class TavilyMCPClient:
 
             LOGGER.info(f"MCP tavily_search: {query[:50]}...")
 
-            result = await self._session.call_tool("tavily_search", arguments=arguments)
+            # On a rate-limit rejection, pause every worker for the server-given delay and retry
+            for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+                waited = get_rate_limiter().acquire()
+                if waited:
+                    LOGGER.info(f"Tavily rate limiter waited {waited:.2f}s")
+
+                try:
+                    result = await self._session.call_tool("tavily_search", arguments=arguments)
+                except Exception as e:
+                    delay = _rate_limit_delay(e)
+                    if delay is None or attempt == self.RATE_LIMIT_RETRIES:
+                        raise
+                else:
+                    error_text = " ".join(getattr(item, "text", "") for item in result.content or [])
+                    delay = _rate_limit_delay(error_text) if result.isError else None
+                    if delay is None or attempt == self.RATE_LIMIT_RETRIES:
+                        break
+
+                LOGGER.warning(f"Tavily rate limit hit, pausing searches for {delay:.1f}s")
+                get_rate_limiter().pause(delay)
 
             if result.content and len(result.content) > 0:
                 content_item = result.content[0]
@@ -7,7 +7,9 @@ import requests
 from PIL import Image
 from io import BytesIO
 import os
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterable
 from src.utils.utilities import plot_clusters_on_basemap
 from src.utils.logger import LOGGER
 
@@ -65,6 +67,82 @@ def _get_docx_labels(language: str) -> Dict[str, str]:
     return DOCX_LABELS.get(language, DOCX_LABELS["en"])
 
 
+@lru_cache(maxsize=64)
+def _fetch_image_bytes(url: str, timeout: float = 30) -> bytes:
+    """
+    Download an image by streaming the response body into memory.
+
+    Successful downloads are kept in a small in-process LRU cache, so an image reused
+    across documents in the same session is only fetched once. Failures raise and are
+    therefore not cached.
+
+    Raises:
+        requests.HTTPError: If the server does not answer with HTTP 200
+    """
+    with requests.get(url, timeout=timeout, stream=True) as response:
+        if response.status_code != 200:
+            raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+
+        buffer = BytesIO()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            buffer.write(chunk)
+
+    return buffer.getvalue()
+
+
+def _download_image(url: str) -> Optional[BytesIO]:
+    """
+    Download an image (served from the session cache when already fetched).
+
+    Args:
+        url: Image URL
+
+    Returns:
+        Buffer positioned at the start of the image bytes, or None if the download failed
+    """
+    try:
+        return BytesIO(_fetch_image_bytes(url))
+    except requests.HTTPError as e:
+        LOGGER.warning(f"Image download returned {e}: {url}")
+        return None
+
+
+def _try_download_image(url: str) -> Optional[BytesIO]:
+    """Download an image, logging and returning None on any error."""
+    try:
+        return _download_image(url)
+    except Exception as e:
+        LOGGER.warning(f"Error downloading image {url}: {e}")
+        return None
+
+
+def prefetch_images(urls: Iterable[str]) -> Dict[str, Optional[BytesIO]]:
+    """
+    Download images concurrently before the document is assembled.
+
+    Concurrency is capped by IMAGE_DOWNLOAD_MAX_WORKERS (default: 8) so image hosts
+    are not flooded with requests.
+
+    Args:
+        urls: Image URLs (duplicates are downloaded once)
+
+    Returns:
+        Mapping of URL to image bytes, or None for downloads that failed
+    """
+    unique_urls = list(dict.fromkeys(url for url in urls if url))
+    if not unique_urls:
+        return {}
+
+    max_workers = min(int(os.getenv("IMAGE_DOWNLOAD_MAX_WORKERS", "8")), len(unique_urls))
+    LOGGER.info(f"Prefetching {len(unique_urls)} images with {max_workers} workers...")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = dict(zip(unique_urls, executor.map(_try_download_image, unique_urls)))
+
+    downloaded = sum(1 for image in results.values() if image is not None)
+    LOGGER.info(f"Prefetched {downloaded}/{len(unique_urls)} images")
+    return results
+
+
 def add_horizontal_line(paragraph, color: RGBColor = COLORS["primary"], width: float = 1.0):
     """Add a horizontal line below a paragraph."""
     p = paragraph._p
@@ -254,25 +332,28 @@ class LocalDocxGenerator:
     def create_document(
         self,
         title: str,
-        content_blocks: List[Dict[str, Any]],
+        content_blocks: Iterable[Dict[str, Any]],
         output_filename: Optional[str] = None,
-        language: str = "en"
+        language: str = "en",
+        images: Optional[Dict[str, Optional[BytesIO]]] = None
     ) -> str:
         """
         Create a DOCX document with formatted content and images.
 
         Args:
             title: Document title
-            content_blocks: List of content blocks (text, images, etc.)
+            content_blocks: Content blocks (text, images, etc.); any iterable, consumed once
+                as the document is written, so a generator avoids building the full list
             output_filename: Optional custom filename
             language: Language code for localized strings (en, pt-br, es, fr)
+            images: Optional prefetched images (see prefetch_images); image blocks whose
+                URL is missing from it are downloaded on the spot
 
         Returns:
             Path to the created document
         """
         LOGGER.info("=== DOCX CREATION START ===")
         LOGGER.info(f"Title: {title}")
-        LOGGER.info(f"Content blocks: {len(content_blocks)}")
         LOGGER.info(f"Language: {language}")
 
         # Get language-specific labels
@@ -291,9 +372,10 @@ class LocalDocxGenerator:
 
             # Process content blocks
             LOGGER.info("Processing content blocks...")
-            for i, block in enumerate(content_blocks):
+            block_count = 0
+            for block_count, block in enumerate(content_blocks, start=1):
                 block_type = block.get("type")
-                LOGGER.debug(f"Block {i+1}/{len(content_blocks)}: type={block_type}")
+                LOGGER.debug(f"Block {block_count}: type={block_type}")
 
                 if block_type == "heading":
                     level = block.get("level", 1)
@@ -337,27 +419,29 @@ class LocalDocxGenerator:
                     LOGGER.info(f"Processing image: {image_url[:100]}...")
 
                     try:
-                        # Download image
-                        LOGGER.info(f"Downloading image from: {image_url}")
-                        response = requests.get(image_url, timeout=30)
+                        if images is not None and image_url in images:
+                            image_bytes = images[image_url]
+                        else:
+                            # Download image (streamed straight into memory, no temp file)
+                            LOGGER.info(f"Downloading image from: {image_url}")
+                            image_bytes = _download_image(image_url)
 
-                        if response.status_code == 200:
-                            LOGGER.info(f"Image downloaded successfully ({len(response.content)} bytes)")
+                        if image_bytes is not None:
+                            LOGGER.info(f"Image ready ({image_bytes.getbuffer().nbytes} bytes)")
+                            image_bytes.seek(0)
 
                             # Load image to check dimensions
-                            img = Image.open(BytesIO(response.content))
+                            img = Image.open(image_bytes)
                             LOGGER.info(f"Image opened: {img.size}, format: {img.format}")
 
-                            # Save to temp file
-                            temp_path = os.path.join(self.output_dir, f"temp_{block.get('id', 'img')}.jpg")
-                            LOGGER.info(f"Saving to temp file: {temp_path}")
-
-                            img.save(temp_path, "JPEG")
-                            LOGGER.info("Temp file saved successfully")
+                            # Re-encode as JPEG so any source format can be embedded
+                            jpeg_bytes = BytesIO()
+                            img.save(jpeg_bytes, "JPEG")
+                            jpeg_bytes.seek(0)
 
                             # Add to document (max width 5.5 inches for better margins)
                             LOGGER.info("Adding picture to document...")
-                            doc.add_picture(temp_path, width=Inches(5.5))
+                            doc.add_picture(jpeg_bytes, width=Inches(5.5))
                             LOGGER.info("Picture added successfully")
 
                             # Add styled caption
@@ -372,12 +456,8 @@ class LocalDocxGenerator:
                                 run.italic = True
 
                                 caption_para.paragraph_format.space_after = Pt(12)
-
-                            # Clean up temp file
-                            os.remove(temp_path)
-                            LOGGER.info("Temp file removed")
                         else:
-                            LOGGER.warning(f"Failed to download image: HTTP {response.status_code}")
+                            LOGGER.warning(f"Failed to download image: {image_url}")
 
                     except Exception as e:
                         LOGGER.error(f"Error adding image: {e}", exc_info=True)
@@ -433,6 +513,8 @@ class LocalDocxGenerator:
                     else:
                         LOGGER.warning("No clusters or coordinates provided for final image.")
 
+            LOGGER.info(f"Processed {block_count} content blocks")
+
             # Save document
             LOGGER.info("Saving document...")
             if not output_filename:
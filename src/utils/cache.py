@@ -0,0 +1,85 @@
+"""
+On-disk JSON cache for deterministic, expensive computations.
+
+Each entry is stored as one JSON file under ./.cache/<namespace>/<key>.json,
+so results survive across runs of the CLI. Entries can optionally expire after a TTL.
+"""
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from typing import Any, Optional
+from src.utils.logger import LOGGER
+
+
+def make_cache_key(payload: Any) -> str:
+    """
+    Build a stable hash key from a JSON-serializable payload.
+
+    Args:
+        payload: Canonical description of the cached computation's inputs
+
+    Returns:
+        Hex digest usable as a cache key
+    """
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class DiskCache:
+    """
+    Persistent key-value cache backed by JSON files.
+    """
+
+    def __init__(self, namespace: str, cache_dir: str = "./.cache", ttl_seconds: Optional[float] = None):
+        """
+        Initialize the disk cache.
+
+        Args:
+            namespace: Subdirectory name isolating this cache's entries
+            cache_dir: Root directory for all caches
+            ttl_seconds: Optional entry lifetime; expired entries are treated as missing
+        """
+        self.directory = os.path.join(cache_dir, namespace)
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or unreadable."""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            LOGGER.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+        if not isinstance(entry, dict) or "value" not in entry:
+            return None
+
+        if self.ttl_seconds is not None and time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            return None
+
+        return entry["value"]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key (atomic replace)."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"created_at": time.time(), "value": value}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            LOGGER.warning(f"Could not write cache entry {key}: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries of this cache."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory, exist_ok=True)
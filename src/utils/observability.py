@@ -7,6 +7,8 @@ LangSmith provides:
 - Cost estimation
 - Full trace visualization
 - Error tracking
+- Spans for the non-LLM hot paths (geocoding, Tavily searches, day organization)
+  via @traceable in src/agent/tools.py
 
 Setup:
 1. Create account at https://smith.langchain.com
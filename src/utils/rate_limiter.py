@@ -0,0 +1,77 @@
+"""
+Thread-safe token bucket rate limiter.
+
+Used to pace calls to rate-limited external APIs (web search, geocoding) across the
+parallel worker threads of the graph.
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket that refills at a fixed rate up to a maximum burst size.
+
+    acquire() blocks the calling thread until a token is available. pause() holds back
+    every caller for a while, e.g. when the server reports that the limit was hit.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens that can accumulate
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def pause(self, seconds: float) -> None:
+        """
+        Block all acquire() calls for the given time and drop accumulated tokens.
+
+        Args:
+            seconds: How long to hold back callers (e.g. a server's Retry-After)
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            # Refill restarts when the pause ends, so no burst builds up meanwhile
+            self._tokens = 0.0
+            self._last_refill = self._paused_until
+
+    def acquire(self) -> float:
+        """
+        Take one token, waiting for it if necessary.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait_time = self._paused_until - now
+                else:
+                    self._refill()
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+            waited += wait_time
@@ -1,9 +1,4 @@
-import matplotlib.pyplot as plt
-from matplotlib.lines import Line2D
-from shapely.geometry import Point
-import geopandas as gpd
-import contextily as ctx
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 
 def plot_clusters_on_basemap(
@@ -17,6 +12,14 @@ def plot_clusters_on_basemap(
     Plot clustered points over a static basemap and save an image.
     Uses a legend to identify points instead of labels on the map.
     """
+    # Plotting libraries are imported here so that importing the state reducers
+    # below does not pull in matplotlib and geopandas
+    import matplotlib.pyplot as plt
+    from matplotlib.lines import Line2D
+    from shapely.geometry import Point
+    import geopandas as gpd
+    import contextily as ctx
+
     crs_mercator = "EPSG:3857"
     crs_input = "EPSG:4326"
     provider_key = "CartoDB.Positron"
@@ -143,12 +146,31 @@ def plot_clusters_on_basemap(
 
 
 def merge_dicts(left: Dict, right: Dict) -> Dict:
-    """Merge two dictionaries, with right taking precedence."""
+    """
+    Merge right into left in place, with right taking precedence.
+
+    The reducer owns the accumulated dict, so updating it avoids copying all
+    existing entries on every merge.
+    """
+    if left is None:
+        return dict(right) if right is not None else {}
+    if right:
+        left.update(right)
+    return left
+
+
+def extend_list(left: List, right: List) -> List:
+    """
+    Append right's items to left in place (list accumulation reducer).
+
+    Unlike operator.add, this does not copy the accumulated list on every merge,
+    so collecting results from parallel Send() calls stays linear.
+    """
     if left is None:
-        return right
-    if right is None:
-        return left
-    return {**left, **right}
+        return list(right) if right is not None else []
+    if right:
+        left.extend(right)
+    return left
 
 
 def replace_value(left: Any, right: Any) -> Any: